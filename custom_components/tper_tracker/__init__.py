@@ -1,18 +1,43 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.const import Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.typing import ConfigType
 
 from .coordinator import TperDataUpdateCoordinator
-from .const import CONF_LINE_IDS, CONF_LINE_NAMES, DOMAIN
+from .const import (
+    CONF_LINE_IDS,
+    CONF_LINE_NAMES,
+    DATA_SCHEDULER,
+    DATA_SESSION,
+    DOMAIN,
+    SIGNAL_COORDINATOR_ADDED,
+)
+from .polling import PollingPolicy
+from .scheduler import TperRefreshScheduler
+from .session import TperSessionManager
+from .websocket_api import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
 # Define supported platforms for this integration
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.CALENDAR, Platform.EVENT, Platform.SENSOR]
+
+# The integration is set up from config entries only
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+# Register integration-wide services such as the websocket API
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    async_register_websocket_commands(hass)
+    return True
 
 
 # Main entry point for setting up the TPER Tracker integration
@@ -38,22 +63,59 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             options=options
         )
 
-    # Initialize the data coordinator and perform first refresh
+    # Share one refresh scheduler and rate limiter across all entries
+    if DATA_SCHEDULER not in hass.data:
+        hass.data[DATA_SCHEDULER] = TperRefreshScheduler()
+    scheduler: TperRefreshScheduler = hass.data[DATA_SCHEDULER]
+    line_ids = entry.options.get(CONF_LINE_IDS, entry.data.get(CONF_LINE_IDS, []))
+    scheduler.register(
+        entry.entry_id,
+        PollingPolicy.from_options(entry.options).projected_calls_per_day(len(line_ids)),
+    )
+
+    # Share one tuned WebBus session across all entries
+    if DATA_SESSION not in hass.data:
+        hass.data[DATA_SESSION] = _async_create_session_manager(hass)
+    session = hass.data[DATA_SESSION].acquire(entry.entry_id)
+
+    # Initialize the data coordinator and perform first refresh, deferring it
+    # when many entries are set up at once (startup or bulk import)
     try:
-        coordinator = TperDataUpdateCoordinator(hass, entry)
-        await coordinator.async_config_entry_first_refresh()
+        coordinator = TperDataUpdateCoordinator(hass, entry, scheduler, session)
+        if delay := scheduler.startup_delay():
+            _LOGGER.debug("Deferring first refresh of entry %s by %.0fs", entry.entry_id, delay)
+
+            # No polling until the deferred refresh, or entities adding their
+            # listeners would schedule one a single interval after setup
+            initial_interval = coordinator.update_interval
+            coordinator.update_interval = None
+
+            @callback
+            def _async_deferred_first_refresh(_now: datetime) -> None:
+                coordinator.update_interval = initial_interval
+                hass.async_create_task(coordinator.async_refresh())
+
+            entry.async_on_unload(
+                async_call_later(hass, delay, _async_deferred_first_refresh)
+            )
+        else:
+            await coordinator.async_config_entry_first_refresh()
     except Exception as err:
         _LOGGER.error("Failed to initialize coordinator for entry %s: %s", entry.entry_id, err)
+        await _async_release_shared(hass, entry)
         return False
 
     # Store coordinator in hass data for access by platforms
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    async_dispatcher_send(hass, SIGNAL_COORDINATOR_ADDED, coordinator)
     
-    # Set up all platforms (sensors) for this integration
+    # Set up all platforms (calendar, events, sensors) for this integration
     try:
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     except Exception as err:
         _LOGGER.error("Failed to setup platforms for entry %s: %s", entry.entry_id, err)
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await _async_release_shared(hass, entry)
         return False
     
     # Register reload listener for configuration changes
@@ -72,6 +134,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
         if unload_ok:
             hass.data[DOMAIN].pop(entry.entry_id)
+            await _async_release_shared(hass, entry)
             _LOGGER.info("TPER Tracker entry %s unloaded successfully", entry.entry_id)
         return unload_ok
     except Exception as err:
@@ -79,6 +142,29 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
 
 
+# Create the session manager and close its session when Home Assistant stops
+def _async_create_session_manager(hass: HomeAssistant) -> TperSessionManager:
+    manager = TperSessionManager()
+
+    async def _async_close_session(event: Event) -> None:
+        await manager.async_close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    return manager
+
+
+# Release an entry's share of the scheduler and session, dropping them with the last entry
+async def _async_release_shared(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is not None:
+        scheduler.unregister(entry.entry_id)
+        if scheduler.is_empty:
+            _LOGGER.debug("Refresh scheduler stats at last unload: %s", scheduler.stats)
+            hass.data.pop(DATA_SCHEDULER)
+
+    if (session_manager := hass.data.get(DATA_SESSION)) is not None:
+        await session_manager.async_release(entry.entry_id)
+
+
 # Function to reload the integration entry when configuration changes
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     _LOGGER.info("Reloading TPER Tracker entry %s", entry.entry_id)
@@ -2,13 +2,19 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 import time
-from typing import Any
+from collections import Counter
+from typing import Any, NamedTuple
 
 from aiohttp import ClientError, ClientSession, ClientTimeout
 
 from .const import (
+    API_CONNECT_TIMEOUT,
+    API_READ_TIMEOUT,
     API_TIMEOUT,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_RATE_LIMIT_CALLS_PER_SECOND,
     REAL_TIME_URL,
     STOP_LINES_URL,
     STOP_SEARCH_URL,
@@ -16,42 +22,110 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Request timeout built once, with separate connect and read limits
+REQUEST_TIMEOUT = ClientTimeout(
+    total=API_TIMEOUT,
+    connect=API_CONNECT_TIMEOUT,
+    sock_read=API_READ_TIMEOUT,
+)
+
+
+# Retry and backoff policy attached to each classified error type
+class RetryPolicy(NamedTuple):
+    max_retries: int = 0
+    backoff: float = 0.0
 
-# Base exception class for TPER API errors
+
+# Base exception class for TPER API errors, also raised for timeouts and HTTP errors
 class TperApiError(Exception):
-    pass
+    error_key = "api_error"
+    retry_policy = RetryPolicy(max_retries=2, backoff=1.0)
 
 
 # Exception for when API returns no results
 class TperApiNoResults(TperApiError):
-    pass
+    error_key = "no_results"
+    retry_policy = RetryPolicy()
 
 
 # Exception for when real-time information is not available
 class TperApiRealTimeNotAvailableError(TperApiError):
-    pass
+    error_key = "not_available"
+    retry_policy = RetryPolicy()
 
 
 # Exception for when no more buses are scheduled
 class TperApiNoMoreBusesError(TperApiError):
-    pass
+    error_key = "no_more_buses"
+    retry_policy = RetryPolicy()
 
 
 # Exception for TPER system errors
 class TperApiSystemError(TperApiError):
-    pass
+    error_key = "system_error"
+    retry_policy = RetryPolicy(max_retries=1, backoff=2.0)
+
+
+# Exception for WebBus error messages not in the classification table
+class TperApiRejectedError(TperApiError):
+    error_key = "rejected"
+    retry_policy = RetryPolicy()
+
+
+# Classification table mapping WebBus error messages to exception types
+ERROR_CLASSIFICATION: tuple[tuple[str, type[TperApiError]], ...] = (
+    ("Informazioni in tempo reale non disponibili", TperApiRealTimeNotAvailableError),
+    ("prevista nessun'altra corsa", TperApiNoMoreBusesError),
+    ("qualche problema con il sistema di informazioni in tempo reale", TperApiSystemError),
+)
+
+# Single precompiled pattern with one named group per table row
+_ERROR_PATTERN = re.compile(
+    "|".join(
+        f"(?P<e{index}>{re.escape(substring)})"
+        for index, (substring, _) in enumerate(ERROR_CLASSIFICATION)
+    )
+)
+
+
+# Build the matching exception for a WebBus error message
+def classify_error(error_msg: str) -> TperApiError:
+    if match := _ERROR_PATTERN.search(error_msg):
+        _, exc_class = ERROR_CLASSIFICATION[int(match.lastgroup[1:])]
+        return exc_class(error_msg)
+    return TperApiRejectedError(error_msg or "Unknown API error")
 
 
 # Rate limiter class to control API request frequency
 class RateLimiter:
-    def __init__(self, calls_per_second: float = 2.0) -> None:
+    def __init__(self, calls_per_second: float = DEFAULT_RATE_LIMIT_CALLS_PER_SECOND) -> None:
         self._calls_per_second = calls_per_second
         self._min_interval = 1.0 / calls_per_second
         self._last_call_time = 0.0
         self._lock = asyncio.Lock()
+        self._acquisitions = 0
+        self._blocked = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+    
+    # Sustained call rate the limiter allows
+    @property
+    def calls_per_second(self) -> float:
+        return self._calls_per_second
+    
+    # Queue wait statistics for reporting how often callers are blocked
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "acquisitions": self._acquisitions,
+            "blocked": self._blocked,
+            "mean_wait": self._total_wait / self._acquisitions if self._acquisitions else 0.0,
+            "max_wait": self._max_wait,
+        }
     
     # Acquire rate limit permission before making API call
     async def acquire(self) -> None:
+        queued_at = time.monotonic()
         async with self._lock:
             current_time = time.time()
             time_since_last_call = current_time - self._last_call_time
@@ -61,17 +135,59 @@ class RateLimiter:
                 await asyncio.sleep(sleep_time)
             
             self._last_call_time = time.time()
+            
+            # Record time spent queued behind the lock and the interval sleep
+            wait = time.monotonic() - queued_at
+            self._acquisitions += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            if wait >= 0.001:
+                self._blocked += 1
 
 
 # Main API client class for interacting with TPER web services
 class TperApiClient:
-    def __init__(self, session: ClientSession) -> None:
+    def __init__(
+        self, session: ClientSession, rate_limiter: RateLimiter | None = None
+    ) -> None:
         self._session = session
-        self._rate_limiter = RateLimiter(calls_per_second=2.0)
+        self._rate_limiter = rate_limiter or RateLimiter()
+        self._request_count = 0
+        self._error_counts: Counter[str] = Counter()
+
+    # Request and per-error-type counters for error rate reporting
+    @property
+    def error_stats(self) -> dict[str, Any]:
+        return {
+            "requests": self._request_count,
+            "errors": dict(self._error_counts),
+        }
+
+    # Internal method to make HTTP requests, retrying per the error's policy
+    async def _request(
+        self, url: str, params: dict[str, Any], retry: bool = True
+    ) -> dict[str, Any]:
+        attempt = 0
+        while True:
+            try:
+                return await self._request_once(url, params)
+            except TperApiError as exc:
+                self._error_counts[exc.error_key] += 1
+                policy = exc.retry_policy
+                if not retry or attempt >= policy.max_retries:
+                    raise
+                delay = policy.backoff * (2 ** attempt)
+                attempt += 1
+                _LOGGER.debug(
+                    "Retrying %s after %s (attempt %d, backoff %.1fs)",
+                    url, exc.error_key, attempt, delay
+                )
+                await asyncio.sleep(delay)
 
-    # Internal method to make HTTP requests to TPER API
-    async def _request(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
+    # Perform a single HTTP request to TPER API
+    async def _request_once(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
         await self._rate_limiter.acquire()
+        self._request_count += 1
         
         # Add standard parameters required by TPER API
         params.update({
@@ -80,8 +196,7 @@ class TperApiClient:
         })
 
         try:
-            timeout = ClientTimeout(total=API_TIMEOUT)
-            async with self._session.get(url, params=params, timeout=timeout) as response:
+            async with self._session.get(url, params=params, timeout=REQUEST_TIMEOUT) as response:
                 response.raise_for_status()
                 data = await response.json()
         except asyncio.TimeoutError as exc:
@@ -96,15 +211,7 @@ class TperApiClient:
             if "risultati" in data and data["risultati"] and "Nessun risultato!" in data["risultati"][0].get("head", ""):
                 raise TperApiNoResults("No results found")
             
-            error_msg = data.get("errore", "")
-            if "Informazioni in tempo reale non disponibili" in error_msg:
-                raise TperApiRealTimeNotAvailableError(error_msg)
-            if "prevista nessun'altra corsa" in error_msg:
-                raise TperApiNoMoreBusesError(error_msg)
-            if "qualche problema con il sistema di informazioni in tempo reale" in error_msg:
-                raise TperApiSystemError(error_msg)
-
-            raise TperApiError(error_msg or "Unknown API error")
+            raise classify_error(data.get("errore", ""))
             
         return data
 
@@ -124,30 +231,61 @@ class TperApiClient:
         return data.get("risultati", [])
 
     # Get real-time bus data for a specific stop and line
-    async def async_get_real_time_data(self, stop_id: int, line_id: int) -> dict[str, Any]:
+    async def async_get_real_time_data(
+        self, stop_id: int, line_id: int, retry: bool = True
+    ) -> dict[str, Any]:
         params = {"t": "bus", "id": stop_id, "idL": line_id, "o": "null"}
-        return await self._request(REAL_TIME_URL, params)
+        return await self._request(REAL_TIME_URL, params, retry=retry)
     
-    # Get real-time data for multiple lines concurrently
+    # Get real-time data for multiple lines concurrently, retrying only failed lines
     async def async_get_multiple_real_time_data(
         self, 
         stop_id: int, 
         line_ids: list[int], 
-        max_concurrent: int = 3
-    ) -> dict[str, dict[str, Any]]:
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        retry_budget: int | None = None,
+    ) -> dict[str, dict[str, Any] | TperApiError]:
         semaphore = asyncio.Semaphore(max_concurrent)
+        results: dict[str, dict[str, Any] | TperApiError] = {}
+        attempts: dict[int, int] = {}
+        budget = len(line_ids) if retry_budget is None else retry_budget
         
         # Helper function to fetch data for a single line with concurrency control
-        async def get_line_data(line_id: int) -> tuple[str, dict[str, Any]]:
+        async def get_line_data(line_id: int) -> None:
             async with semaphore:
                 try:
-                    data = await self.async_get_real_time_data(stop_id, line_id)
-                    return str(line_id), data
-                except Exception as exc:
-                    return str(line_id), {"error": str(exc)}
+                    results[str(line_id)] = await self.async_get_real_time_data(
+                        stop_id, line_id, retry=False
+                    )
+                except TperApiError as exc:
+                    results[str(line_id)] = exc
         
-        # Execute all requests concurrently and gather results
-        tasks = [get_line_data(line_id) for line_id in line_ids]
-        results = await asyncio.gather(*tasks)
+        # Fetch all lines, then retry failed ones concurrently in rounds
+        pending = list(line_ids)
+        while pending:
+            await asyncio.gather(*(get_line_data(line_id) for line_id in pending))
+            
+            retry_ids = []
+            delay = 0.0
+            for line_id in pending:
+                result = results[str(line_id)]
+                if not isinstance(result, TperApiError):
+                    continue
+                attempt = attempts.get(line_id, 0)
+                policy = result.retry_policy
+                if budget <= 0 or attempt >= policy.max_retries:
+                    continue
+                budget -= 1
+                attempts[line_id] = attempt + 1
+                delay = max(delay, policy.backoff * (2 ** attempt))
+                retry_ids.append(line_id)
+            
+            if retry_ids:
+                _LOGGER.debug(
+                    "Retrying %d failed lines for stop %s after %.1fs",
+                    len(retry_ids), stop_id, delay
+                )
+                await asyncio.sleep(delay)
+            pending = retry_ids
         
-        return dict(results)
\ No newline at end of file
+        return {str(line_id): results[str(line_id)] for line_id in line_ids}
\ No newline at end of file
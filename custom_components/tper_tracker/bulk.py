@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import logging
+from typing import NamedTuple
+
+import yaml
+
+from .api import TperApiClient, TperApiError
+from .const import DEFAULT_MAX_CONCURRENT_REQUESTS, MAX_LINES_PER_STOP
+
+_LOGGER = logging.getLogger(__name__)
+
+# Reasons a stop is left out of a bulk import, translated in the confirm step
+REJECT_ALREADY_CONFIGURED = "already_configured"
+REJECT_LOOKUP_FAILED = "lookup_failed"
+REJECT_NO_LINES = "no_lines"
+REJECT_UNKNOWN_LINES = "unknown_lines"
+REJECT_TOO_MANY_LINES = "too_many_lines"
+BULK_REJECT_REASONS = (
+    REJECT_ALREADY_CONFIGURED,
+    REJECT_LOOKUP_FAILED,
+    REJECT_NO_LINES,
+    REJECT_UNKNOWN_LINES,
+    REJECT_TOO_MANY_LINES,
+)
+
+
+# Stop and line codes requested by one row of a bulk import
+class BulkStopRequest(NamedTuple):
+    stop_id: int
+    line_codes: tuple[str, ...]
+
+
+# Stop left out of a bulk import, with a language-neutral detail such as line codes
+class BulkRejection(NamedTuple):
+    reason: str
+    detail: str = ""
+
+
+# Validated stop ready to be created as a config entry
+class BulkStop(NamedTuple):
+    stop_id: int
+    stop_name: str
+    line_names: dict[str, str]
+
+
+# Parse a pasted YAML or CSV list of stops into requests, merging duplicate stops
+def parse_bulk_stops(text: str) -> list[BulkStopRequest]:
+    try:
+        loaded = yaml.safe_load(text)
+    except yaml.YAMLError:
+        loaded = None
+
+    # YAML: a mapping of stop ID to lines, or a list of {stop_id, lines} items
+    if isinstance(loaded, dict):
+        rows = [(stop_id, lines) for stop_id, lines in loaded.items()]
+    elif isinstance(loaded, list):
+        rows = []
+        for item in loaded:
+            if isinstance(item, dict):
+                rows.append((item.get("stop_id"), item.get("lines")))
+            else:
+                rows.append((item, None))
+    else:
+        # CSV: stop ID followed by optional line codes on each row
+        rows = []
+        header_checked = False
+        for row in csv.reader(text.splitlines()):
+            cells = [cell.strip() for cell in row if cell.strip()]
+            if not cells or cells[0].startswith("#"):
+                continue
+            # Skip a header row such as "stop_id,lines"
+            is_header = not header_checked and not cells[0].isdigit()
+            header_checked = True
+            if not is_header:
+                rows.append((cells[0], cells[1:]))
+
+    merged: dict[int, list[str]] = {}
+    for stop_id, lines in rows:
+        try:
+            stop_id_int = int(stop_id)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid stop ID: {stop_id}") from None
+        if stop_id_int <= 0 or stop_id_int > 999999:
+            raise ValueError(f"Invalid stop ID: {stop_id}")
+
+        if lines is None:
+            codes: list[str] = []
+        elif isinstance(lines, (list, tuple)):
+            codes = [str(code).strip() for code in lines]
+        else:
+            codes = str(lines).replace(";", " ").split()
+
+        known = merged.setdefault(stop_id_int, [])
+        known.extend(code for code in codes if code and code not in known)
+
+    if not merged:
+        raise ValueError("No stops found")
+    return [
+        BulkStopRequest(stop_id, tuple(codes)) for stop_id, codes in merged.items()
+    ]
+
+
+# Validate all requested stops in one throttled pass, one lookup per unique stop
+async def async_validate_bulk_stops(
+    api_client: TperApiClient, requests: list[BulkStopRequest]
+) -> tuple[list[BulkStop], dict[int, BulkRejection]]:
+    semaphore = asyncio.Semaphore(DEFAULT_MAX_CONCURRENT_REQUESTS)
+    valid: list[BulkStop] = []
+    errors: dict[int, BulkRejection] = {}
+
+    # Resolve a single stop's name and requested line codes
+    async def validate(request: BulkStopRequest) -> None:
+        async with semaphore:
+            try:
+                lines = await api_client.async_get_stop_lines(request.stop_id)
+                stops = await api_client.async_search_stops(str(request.stop_id))
+            except TperApiError as exc:
+                errors[request.stop_id] = BulkRejection(REJECT_LOOKUP_FAILED, exc.error_key)
+                return
+
+        if not lines:
+            errors[request.stop_id] = BulkRejection(REJECT_NO_LINES)
+            return
+
+        line_ids_by_code = {
+            str(line["codiceLinea"]): str(line["idLinea"]) for line in lines
+        }
+        codes = request.line_codes or tuple(line_ids_by_code)
+        if unknown := [code for code in codes if code not in line_ids_by_code]:
+            errors[request.stop_id] = BulkRejection(REJECT_UNKNOWN_LINES, ", ".join(unknown))
+            return
+        if len(codes) > MAX_LINES_PER_STOP:
+            errors[request.stop_id] = BulkRejection(REJECT_TOO_MANY_LINES, str(len(codes)))
+            return
+
+        stop_name = next(
+            (stop["head"] for stop in stops if stop.get("id") == request.stop_id),
+            f"Stop {request.stop_id}",
+        )
+        valid.append(
+            BulkStop(
+                stop_id=request.stop_id,
+                stop_name=stop_name,
+                line_names={line_ids_by_code[code]: code for code in codes},
+            )
+        )
+
+    await asyncio.gather(*(validate(request) for request in requests))
+    valid.sort(key=lambda stop: stop.stop_id)
+    _LOGGER.debug(
+        "Bulk validation: %d valid, %d rejected, API stats %s",
+        len(valid), len(errors), api_client.error_stats
+    )
+    return valid, errors
\ No newline at end of file
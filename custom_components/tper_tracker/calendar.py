@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_STOP_ID, DOMAIN
+from .coordinator import TperDataUpdateCoordinator
+from .departures import Departure
+from .entity import stop_device_info
+
+_LOGGER = logging.getLogger(__name__)
+
+# Duration given to each departure event in the calendar
+DEPARTURE_DURATION = timedelta(minutes=1)
+
+
+# Setup function for creating the departures calendar entity
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    coordinator: TperDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([TperDeparturesCalendar(coordinator, entry)])
+
+
+# Calendar entity merging the cached departures of all lines at a stop
+class TperDeparturesCalendar(CoordinatorEntity[TperDataUpdateCoordinator], CalendarEntity):
+    _attr_translation_key = "departures"
+    _attr_icon = "mdi:bus-clock"
+    _attr_has_entity_name = True
+
+    # Initialize calendar with coordinator and config entry
+    def __init__(self, coordinator: TperDataUpdateCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator)
+        stop_id = entry.data[CONF_STOP_ID]
+
+        self._attr_unique_id = f"{DOMAIN}_{stop_id}_departures"
+        self._attr_device_info = stop_device_info(stop_id)
+
+    # Return the departure in progress or the next upcoming one
+    @property
+    def event(self) -> CalendarEvent | None:
+        now = dt_util.now()
+        departures = self.coordinator.timeline.iter_departures(start=now - DEPARTURE_DURATION)
+        if departure := next(departures, None):
+            return self._to_event(departure)
+        return None
+
+    # Return departures in the requested window from cached data only
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        return [
+            self._to_event(departure)
+            for departure in self.coordinator.timeline.iter_departures(
+                start=start_date - DEPARTURE_DURATION, end=end_date
+            )
+        ]
+
+    # Convert a parsed departure into a calendar event
+    @staticmethod
+    def _to_event(departure: Departure) -> CalendarEvent:
+        details = []
+        if departure.satellite:
+            details.append(f"GPS: {departure.satellite}")
+        if departure.accessible:
+            details.append(f"Accessible: {departure.accessible}")
+
+        return CalendarEvent(
+            start=departure.time,
+            end=departure.time + DEPARTURE_DURATION,
+            summary=f"Line {departure.line_name}",
+            description=", ".join(details) or None,
+        )
\ No newline at end of file
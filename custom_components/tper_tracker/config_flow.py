@@ -9,20 +9,56 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import (
+    BooleanSelector,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectOptionDict,
     SelectSelector,
     SelectSelectorConfig,
     SelectSelectorMode,
+    TextSelector,
+    TextSelectorConfig,
 )
 
 from .api import TperApiClient, TperApiError
+from .bulk import (
+    BULK_REJECT_REASONS,
+    REJECT_ALREADY_CONFIGURED,
+    BulkRejection,
+    BulkStop,
+    async_validate_bulk_stops,
+    parse_bulk_stops,
+)
 from .const import (
+    CONF_APPROACHING_MINUTES,
+    CONF_ARRIVING_MINUTES,
+    CONF_BULK_STOPS,
+    CONF_DRY_RUN,
     CONF_LINE_IDS,
     CONF_LINE_NAMES,
+    CONF_POLLING_JITTER,
+    CONF_POLLING_PRESET,
+    CONF_POLLING_TIERS,
+    CONF_SENSOR_MODE,
     CONF_STOP_ID,
     CONF_STOP_NAME,
+    DEFAULT_APPROACHING_MINUTES,
+    DEFAULT_ARRIVING_MINUTES,
+    DEFAULT_POLLING_JITTER,
+    DEFAULT_POLLING_PRESET,
+    DEFAULT_SENSOR_MODE,
     DOMAIN,
+    MAX_LINES_PER_STOP,
+    POLLING_PRESET_AGGRESSIVE,
+    POLLING_PRESET_BALANCED,
+    POLLING_PRESET_CUSTOM,
+    POLLING_PRESET_FRUGAL,
+    PROJECTION_HEADWAY_MINUTES,
+    SENSOR_MODE_BOARD,
+    SENSOR_MODE_LINES,
 )
+from .polling import POLLING_PRESETS, PollingPolicy, format_tiers, parse_tiers
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,8 +91,8 @@ def _validate_line_ids(line_ids: list[str]) -> list[str]:
     if not line_ids:
         raise vol.Invalid("At least one line must be selected")
     
-    if len(line_ids) > 20:
-        raise vol.Invalid("Too many lines selected (max 20)")
+    if len(line_ids) > MAX_LINES_PER_STOP:
+        raise vol.Invalid(f"Too many lines selected (max {MAX_LINES_PER_STOP})")
     
     validated_ids = []
     for line_id in line_ids:
@@ -71,6 +107,18 @@ def _validate_line_ids(line_ids: list[str]) -> list[str]:
     return validated_ids
 
 
+# Validation function for custom polling tiers
+def _validate_polling_tiers(preset: str, tiers_text: str) -> str:
+    if preset != POLLING_PRESET_CUSTOM:
+        return tiers_text
+    
+    try:
+        parse_tiers(tiers_text)
+    except ValueError as err:
+        raise vol.Invalid(str(err)) from err
+    return tiers_text
+
+
 # Main configuration flow class for TPER Tracker setup
 class TperTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
@@ -80,6 +128,8 @@ class TperTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self.data: dict[str, Any] = {}
         self.stops: list[dict[str, Any]] = []
         self.lines: list[dict[str, Any]] = []
+        self.bulk_stops: list[BulkStop] = []
+        self.bulk_rejected: dict[int, BulkRejection] = {}
 
     # Create options flow handler for configuration changes
     @staticmethod
@@ -89,8 +139,12 @@ class TperTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> TperTrackerOptionsFlowHandler:
         return TperTrackerOptionsFlowHandler()
 
-    # Initial step: user enters stop search query
+    # Initial step: user chooses between searching one stop and bulk import
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
+        return self.async_show_menu(step_id="user", menu_options=["search", "bulk"])
+
+    # Search step: user enters stop search query
+    async def async_step_search(self, user_input: dict[str, Any] | None = None):
         errors: dict[str, str] = {}
         
         if user_input is not None:
@@ -116,7 +170,7 @@ class TperTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["stop_query"] = "invalid_query"
 
         return self.async_show_form(
-            step_id="user",
+            step_id="search",
             data_schema=vol.Schema({
                 vol.Required("stop_query"): str
             }),
@@ -242,52 +296,179 @@ class TperTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+    # Bulk step: user pastes a YAML or CSV list of stops and line codes
+    async def async_step_bulk(self, user_input: dict[str, Any] | None = None):
+        errors: dict[str, str] = {}
+        
+        if user_input is not None:
+            try:
+                requests = parse_bulk_stops(user_input[CONF_BULK_STOPS])
+            except ValueError:
+                errors[CONF_BULK_STOPS] = "invalid_bulk_list"
+            else:
+                # Skip stops that are already configured before any lookup
+                configured = self._async_current_ids()
+                self.bulk_rejected = {
+                    request.stop_id: BulkRejection(REJECT_ALREADY_CONFIGURED)
+                    for request in requests
+                    if str(request.stop_id) in configured
+                }
+                requests = [
+                    request for request in requests
+                    if request.stop_id not in self.bulk_rejected
+                ]
+                
+                # Validate the remaining stops in one throttled, deduplicated pass
+                session = async_get_clientsession(self.hass)
+                self.api_client = TperApiClient(session)
+                try:
+                    self.bulk_stops, rejected = await async_validate_bulk_stops(
+                        self.api_client, requests
+                    )
+                except Exception:
+                    errors["base"] = "unknown"
+                else:
+                    self.bulk_rejected.update(rejected)
+                    if self.bulk_stops:
+                        return await self.async_step_bulk_confirm()
+                    errors["base"] = "no_valid_stops"
+
+        return self.async_show_form(
+            step_id="bulk",
+            data_schema=vol.Schema({
+                vol.Required(CONF_BULK_STOPS): TextSelector(
+                    TextSelectorConfig(multiline=True)
+                )
+            }),
+            errors=errors,
+        )
+
+    # Bulk confirmation step: review validated stops, then create their entries
+    async def async_step_bulk_confirm(self, user_input: dict[str, Any] | None = None):
+        if user_input is not None:
+            for stop in self.bulk_stops:
+                self.hass.async_create_task(
+                    self.hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": config_entries.SOURCE_IMPORT},
+                        data={
+                            CONF_STOP_ID: stop.stop_id,
+                            CONF_STOP_NAME: stop.stop_name,
+                            CONF_LINE_NAMES: stop.line_names,
+                        },
+                    )
+                )
+            return self.async_abort(
+                reason="bulk_imported",
+                description_placeholders={"count": str(len(self.bulk_stops))},
+            )
+
+        stops_summary = "\n".join(
+            f"- {stop.stop_name} (#{stop.stop_id}): {', '.join(stop.line_names.values())}"
+            for stop in self.bulk_stops
+        )
+        
+        # Skipped stops grouped per reason; the reason labels live in the translations
+        rejected_by_reason: dict[str, list[str]] = {reason: [] for reason in BULK_REJECT_REASONS}
+        for stop_id, rejection in sorted(self.bulk_rejected.items()):
+            rejected_by_reason[rejection.reason].append(
+                f"#{stop_id} ({rejection.detail})" if rejection.detail else f"#{stop_id}"
+            )
+
+        return self.async_show_form(
+            step_id="bulk_confirm",
+            description_placeholders={
+                "count": str(len(self.bulk_stops)),
+                "stops": stops_summary,
+                **{
+                    reason: ", ".join(stop_ids) or "-"
+                    for reason, stop_ids in rejected_by_reason.items()
+                },
+            },
+        )
+
+    # Import step: create an entry for a stop already validated by the bulk step
+    async def async_step_import(self, import_data: dict[str, Any]):
+        await self.async_set_unique_id(str(import_data[CONF_STOP_ID]))
+        self._abort_if_unique_id_configured()
+        
+        line_names = import_data[CONF_LINE_NAMES]
+        return self.async_create_entry(
+            title=import_data[CONF_STOP_NAME],
+            data={
+                CONF_STOP_ID: import_data[CONF_STOP_ID],
+                CONF_STOP_NAME: import_data[CONF_STOP_NAME],
+            },
+            options={
+                CONF_LINE_IDS: list(line_names),
+                CONF_LINE_NAMES: line_names,
+            },
+        )
+
+
 # Options flow handler for modifying existing configuration
 class TperTrackerOptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self) -> None:
         self.lines: list[dict[str, Any]] = []
         self.api_client: TperApiClient | None = None
 
-    # Single step for options: modify selected bus lines
+    # Single step for options: modify selected bus lines and polling policy
     async def async_step_init(self, user_input: dict[str, Any] | None = None):
         errors: dict[str, str] = {}
+        options = dict(self.config_entry.options)
+        
+        # Fetch current lines for the configured stop once per flow
+        if not self.lines:
+            session = async_get_clientsession(self.hass)
+            self.api_client = TperApiClient(session)
+            stop_id = self.config_entry.data[CONF_STOP_ID]
+            
+            try:
+                self.lines = await self.api_client.async_get_stop_lines(stop_id)
+            except TperApiError:
+                return self.async_abort(reason="cannot_connect")
+            except Exception:
+                return self.async_abort(reason="cannot_connect")
         
         if user_input is not None:
             try:
                 line_ids = _validate_line_ids(user_input[CONF_LINE_IDS])
-                
+            except vol.Invalid:
+                errors[CONF_LINE_IDS] = "invalid_line_selection"
+            
+            preset = user_input[CONF_POLLING_PRESET]
+            tiers_text = user_input.get(CONF_POLLING_TIERS, "")
+            try:
+                _validate_polling_tiers(preset, tiers_text)
+            except vol.Invalid:
+                errors[CONF_POLLING_TIERS] = "invalid_polling_tiers"
+            
+            if user_input[CONF_ARRIVING_MINUTES] >= user_input[CONF_APPROACHING_MINUTES]:
+                errors[CONF_ARRIVING_MINUTES] = "invalid_event_thresholds"
+            
+            if not errors:
                 # Build updated line names mapping
                 line_names = {
                     str(line["idLinea"]): line["codiceLinea"] 
                     for line in self.lines
                 }
-                selected_line_names = {
-                    line_id: line_names[line_id] 
-                    for line_id in line_ids
+                options = {
+                    CONF_LINE_IDS: line_ids,
+                    CONF_LINE_NAMES: {
+                        line_id: line_names[line_id] 
+                        for line_id in line_ids
+                    },
+                    CONF_POLLING_PRESET: preset,
+                    CONF_POLLING_TIERS: tiers_text,
+                    CONF_POLLING_JITTER: int(user_input[CONF_POLLING_JITTER]),
+                    CONF_SENSOR_MODE: user_input[CONF_SENSOR_MODE],
+                    CONF_APPROACHING_MINUTES: int(user_input[CONF_APPROACHING_MINUTES]),
+                    CONF_ARRIVING_MINUTES: int(user_input[CONF_ARRIVING_MINUTES]),
                 }
-
-                return self.async_create_entry(
-                    title="", 
-                    data={
-                        CONF_LINE_IDS: line_ids,
-                        CONF_LINE_NAMES: selected_line_names,
-                    }
-                )
                 
-            except vol.Invalid:
-                errors[CONF_LINE_IDS] = "invalid_line_selection"
-
-        # Fetch current lines for the configured stop
-        session = async_get_clientsession(self.hass)
-        self.api_client = TperApiClient(session)
-        stop_id = self.config_entry.data[CONF_STOP_ID]
-        
-        try:
-            self.lines = await self.api_client.async_get_stop_lines(stop_id)
-        except TperApiError:
-            return self.async_abort(reason="cannot_connect")
-        except Exception:
-            return self.async_abort(reason="cannot_connect")
+                # Dry run only reports the projection for the submitted values
+                if not user_input.get(CONF_DRY_RUN):
+                    return self.async_create_entry(title="", data=options)
 
         # Create options for line selection
         line_options = [
@@ -298,11 +479,21 @@ class TperTrackerOptionsFlowHandler(config_entries.OptionsFlow):
             for line in self.lines
         ]
 
-        # Get currently selected lines
-        current_line_ids = self.config_entry.options.get(
+        # Get currently selected lines and polling settings
+        current_line_ids = options.get(
             CONF_LINE_IDS, 
             self.config_entry.data.get(CONF_LINE_IDS, [])
         )
+        preset = options.get(CONF_POLLING_PRESET, DEFAULT_POLLING_PRESET)
+        tiers_text = options.get(CONF_POLLING_TIERS) or format_tiers(
+            *POLLING_PRESETS[DEFAULT_POLLING_PRESET][:2]
+        )
+        jitter = options.get(CONF_POLLING_JITTER, DEFAULT_POLLING_JITTER)
+        sensor_mode = options.get(CONF_SENSOR_MODE, DEFAULT_SENSOR_MODE)
+        approaching_minutes = options.get(
+            CONF_APPROACHING_MINUTES, DEFAULT_APPROACHING_MINUTES
+        )
+        arriving_minutes = options.get(CONF_ARRIVING_MINUTES, DEFAULT_ARRIVING_MINUTES)
 
         return self.async_show_form(
             step_id="init",
@@ -316,7 +507,89 @@ class TperTrackerOptionsFlowHandler(config_entries.OptionsFlow):
                         multiple=True,
                         mode=SelectSelectorMode.LIST,
                     )
-                )
+                ),
+                vol.Required(
+                    CONF_SENSOR_MODE,
+                    default=sensor_mode,
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[SENSOR_MODE_LINES, SENSOR_MODE_BOARD],
+                        mode=SelectSelectorMode.LIST,
+                        translation_key=CONF_SENSOR_MODE,
+                    )
+                ),
+                vol.Required(
+                    CONF_POLLING_PRESET,
+                    default=preset,
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[
+                            POLLING_PRESET_AGGRESSIVE,
+                            POLLING_PRESET_BALANCED,
+                            POLLING_PRESET_FRUGAL,
+                            POLLING_PRESET_CUSTOM,
+                        ],
+                        mode=SelectSelectorMode.DROPDOWN,
+                        translation_key=CONF_POLLING_PRESET,
+                    )
+                ),
+                vol.Optional(
+                    CONF_POLLING_TIERS,
+                    default=tiers_text,
+                ): TextSelector(),
+                vol.Required(
+                    CONF_POLLING_JITTER,
+                    default=jitter,
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        max=50,
+                        step=1,
+                        unit_of_measurement="%",
+                        mode=NumberSelectorMode.SLIDER,
+                    )
+                ),
+                vol.Required(
+                    CONF_APPROACHING_MINUTES,
+                    default=approaching_minutes,
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=1,
+                        max=30,
+                        step=1,
+                        unit_of_measurement="min",
+                        mode=NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Required(
+                    CONF_ARRIVING_MINUTES,
+                    default=arriving_minutes,
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        max=10,
+                        step=1,
+                        unit_of_measurement="min",
+                        mode=NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(CONF_DRY_RUN, default=False): BooleanSelector(),
             }),
             errors=errors,
-        )
\ No newline at end of file
+            description_placeholders=self._projection_placeholders(
+                options, len(current_line_ids)
+            ),
+        )
+
+    # Placeholders describing the projected daily API calls for the given options
+    @staticmethod
+    def _projection_placeholders(options: dict[str, Any], line_count: int) -> dict[str, str]:
+        try:
+            policy = PollingPolicy.from_options(options)
+        except ValueError:
+            policy = PollingPolicy.from_options({})
+        
+        return {
+            "projected_calls": str(policy.projected_calls_per_day(line_count)),
+            "headway": str(PROJECTION_HEADWAY_MINUTES),
+        }
\ No newline at end of file
@@ -1,6 +1,13 @@
 # Integration domain identifier
 DOMAIN = "tper_tracker"
 
+# Keys for domain-wide objects stored in hass.data
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+DATA_SESSION = f"{DOMAIN}_session"
+
+# Dispatcher signal sent when a coordinator is set up for an entry
+SIGNAL_COORDINATOR_ADDED = f"{DOMAIN}_coordinator_added"
+
 # TPER API base URL and endpoint URLs
 BASE_API_URL = "https://webus.bo.it/app"
 STOP_SEARCH_URL = f"{BASE_API_URL}/getSelect.php"
@@ -12,12 +19,60 @@ CONF_STOP_ID = "stop_id"
 CONF_STOP_NAME = "stop_name"
 CONF_LINE_IDS = "line_ids"
 CONF_LINE_NAMES = "line_names"
+CONF_POLLING_PRESET = "polling_preset"
+CONF_POLLING_TIERS = "polling_tiers"
+CONF_POLLING_JITTER = "polling_jitter"
+CONF_DRY_RUN = "dry_run"
+CONF_SENSOR_MODE = "sensor_mode"
+CONF_BULK_STOPS = "bulk_stops"
+CONF_APPROACHING_MINUTES = "approaching_minutes"
+CONF_ARRIVING_MINUTES = "arriving_minutes"
 
 # API and update timing configuration
 API_TIMEOUT = 10
+API_CONNECT_TIMEOUT = 4
+API_READ_TIMEOUT = 6
 UPDATE_INTERVAL = 60
 
 # Rate limiting and concurrency settings
 DEFAULT_RATE_LIMIT_CALLS_PER_SECOND = 2.0
 DEFAULT_MAX_CONCURRENT_REQUESTS = 2
-MINIMUM_UPDATE_INTERVAL = 30
\ No newline at end of file
+MINIMUM_UPDATE_INTERVAL = 30
+MAX_RETRIES_PER_REFRESH = 4
+MAX_LINES_PER_STOP = 20
+
+# Connection pool settings for the integration-owned WebBus session
+POOL_LIMIT = 10
+POOL_LIMIT_PER_HOST = 4
+POOL_KEEPALIVE_TIMEOUT = 60
+POOL_DNS_CACHE_TTL = 600
+
+# Polling policy presets and defaults
+POLLING_PRESET_AGGRESSIVE = "aggressive"
+POLLING_PRESET_BALANCED = "balanced"
+POLLING_PRESET_FRUGAL = "frugal"
+POLLING_PRESET_CUSTOM = "custom"
+DEFAULT_POLLING_PRESET = POLLING_PRESET_BALANCED
+DEFAULT_POLLING_JITTER = 10
+PROJECTION_HEADWAY_MINUTES = 15
+
+# Refresh staggering across coordinators
+REFRESH_BURST_WINDOW = 1.0
+ALIGN_TOLERANCE = 0.9
+STARTUP_BURST = 3
+STARTUP_SPACING = 2.0
+STARTUP_WINDOW = 30.0
+
+# Sensor modes: one sensor per line or a single departure board per stop
+SENSOR_MODE_LINES = "lines"
+SENSOR_MODE_BOARD = "board"
+DEFAULT_SENSOR_MODE = SENSOR_MODE_LINES
+BOARD_MAX_DEPARTURES = 10
+
+# Bus event thresholds, in minutes before the predicted arrival
+DEFAULT_APPROACHING_MINUTES = 5
+DEFAULT_ARRIVING_MINUTES = 1
+
+# Largest ETA shift (minutes) still treated as the same bus between refreshes
+EVENT_MATCH_TOLERANCE = 3
+EVENT_TIMER_RESOLUTION = 1.0
\ No newline at end of file
@@ -1,117 +1,99 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
+from aiohttp import ClientSession
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 from homeassistant.util import dt as dt_util
 
-from .api import (
-    TperApiClient,
-    TperApiError,
-    TperApiNoMoreBusesError,
-    TperApiRealTimeNotAvailableError,
-    TperApiSystemError,
-)
+from .api import TperApiClient, TperApiError
 from .const import (
     CONF_LINE_IDS,
+    CONF_LINE_NAMES,
     CONF_STOP_ID,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
     DOMAIN,
-    UPDATE_INTERVAL,
+    MAX_RETRIES_PER_REFRESH,
 )
+from .departures import DepartureTimeline, parse_time_to_datetime
+from .polling import PollingPolicy, next_interval
+from .scheduler import TperRefreshScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Outcome of the most recent fetches for a single line
+@dataclass
+class LineOutcome:
+    last_error: str | None = None
+    consecutive_failures: int = 0
+    last_success: datetime | None = None
+
+
 # Main data coordinator class for TPER API updates
 class TperDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    # Initialize coordinator with API client and configuration
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
-        self.api_client = TperApiClient(async_get_clientsession(hass))
+    # Initialize coordinator with API client, configuration and shared scheduler
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        scheduler: TperRefreshScheduler,
+        session: ClientSession,
+        clock: Callable[[], datetime] = dt_util.now,
+    ) -> None:
+        self._clock = clock
+        self.api_client = TperApiClient(session, scheduler.rate_limiter)
         self.config_entry = entry
+        self._scheduler = scheduler
+        self.line_outcomes: dict[str, LineOutcome] = {}
+        self.timeline = DepartureTimeline(self._parse_time_to_datetime)
+        self.changed_lines: set[str] = set()
+        self.polling_policy = PollingPolicy.from_options(entry.options)
         
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            update_interval=timedelta(seconds=self.polling_policy.interval_for(None)),
         )
 
     # Calculate dynamic update interval based on next bus arrival times
     def _calculate_dynamic_update_interval(self, lines_data: dict[str, Any]) -> timedelta:
-        earliest_bus_time = None
-        current_time = dt_util.now()
-        
-        # Find the earliest bus arrival time across all lines
-        for line_data in lines_data.values():
-            if line_data.get("error") or not line_data.get("risultati"):
-                continue
-                
-            try:
-                time_str = line_data["risultati"][0]["orario"]
-                bus_time = self._parse_time_to_datetime(time_str)
-                
-                if bus_time and bus_time > current_time:
-                    if earliest_bus_time is None or bus_time < earliest_bus_time:
-                        earliest_bus_time = bus_time
-            except (KeyError, ValueError, IndexError):
-                continue
-        
-        # Return default interval if no valid bus time found
-        if earliest_bus_time is None:
-            return timedelta(seconds=UPDATE_INTERVAL)
-        
-        # Calculate time until next bus and set appropriate update frequency
-        time_until_bus = earliest_bus_time - current_time
-        minutes_until_bus = time_until_bus.total_seconds() / 60
-        
-        if minutes_until_bus <= 5:
-            return timedelta(seconds=30)
-        elif minutes_until_bus <= 15:
-            return timedelta(seconds=60)
-        elif minutes_until_bus <= 30:
-            return timedelta(seconds=120)
-        elif minutes_until_bus <= 60:
-            return timedelta(seconds=300)
-        elif minutes_until_bus <= 120:
-            return timedelta(seconds=600)
-        else:
-            return timedelta(seconds=900)
+        return timedelta(
+            seconds=next_interval(lines_data, self._clock(), self.polling_policy)
+        )
 
-    # Parse time string (HH:MM) to datetime object with proper date handling
+    # Parse time string (HH:MM) relative to the coordinator's clock
     def _parse_time_to_datetime(self, time_str: str) -> datetime | None:
-        try:
-            time_obj = datetime.strptime(time_str, "%H:%M").time()
-            
-            now = dt_util.now()
-            today = now.date()
-            
-            # Combine date and time to create full datetime
-            bus_datetime = datetime.combine(today, time_obj)
-            bus_datetime = dt_util.as_local(bus_datetime)
-            
-            # Handle day rollover for late night and early morning buses
-            if bus_datetime < now:
-                current_hour = now.hour
-                bus_hour = time_obj.hour
-                
-                # Check for overnight service or past times
-                if current_hour >= 22 and bus_hour <= 6:
-                    bus_datetime = bus_datetime + timedelta(days=1)
-                elif bus_datetime < now - timedelta(minutes=5):
-                    bus_datetime = bus_datetime + timedelta(days=1)
-            
-            return bus_datetime
-            
-        except ValueError:
-            return None
+        return parse_time_to_datetime(time_str, self._clock())
+
+    # Track a successful fetch for a line
+    def _record_line_success(self, line_id: str) -> None:
+        outcome = self.line_outcomes.setdefault(line_id, LineOutcome())
+        if outcome.consecutive_failures:
+            _LOGGER.debug(
+                "Line %s recovered after %d failed refreshes",
+                line_id, outcome.consecutive_failures
+            )
+        outcome.last_error = None
+        outcome.consecutive_failures = 0
+        outcome.last_success = self._clock()
+
+    # Track a failed fetch for a line without affecting the other lines
+    def _record_line_failure(self, line_id: str, error: TperApiError) -> None:
+        outcome = self.line_outcomes.setdefault(line_id, LineOutcome())
+        outcome.last_error = error.error_key
+        outcome.consecutive_failures += 1
 
     # Main data update method called by coordinator
     async def _async_update_data(self) -> dict[str, Any]:
@@ -123,51 +105,51 @@ class TperDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         
         line_ids_int = [int(line_id) for line_id in line_ids]
+        self._scheduler.record_refresh(self.config_entry.entry_id)
         
-        try:
-            # Attempt concurrent data fetch for all lines
-            lines_data_raw = await self.api_client.async_get_multiple_real_time_data(
-                stop_id, line_ids_int, max_concurrent=2
-            )
-            
-            lines_data = {}
-            
-            # Process each line's data and handle errors
-            for line_id, line_data in lines_data_raw.items():
-                if isinstance(line_data.get("error"), str):
-                    error_msg = line_data["error"]
-                    if "Informazioni in tempo reale non disponibili" in error_msg:
-                        lines_data[line_id] = {"error": "not_available"}
-                    elif "prevista nessun'altra corsa" in error_msg:
-                        lines_data[line_id] = {"error": "no_more_buses"}
-                    elif "qualche problema con il sistema di informazioni in tempo reale" in error_msg:
-                        lines_data[line_id] = {"error": "system_error"}
-                    else:
-                        lines_data[line_id] = {"error": "api_error"}
-                else:
-                    lines_data[line_id] = line_data
-                        
-        except TperApiError:
-            # Fallback to individual requests if concurrent fetch fails
-            lines_data = {}
-            
-            for line_id in line_ids:
-                try:
-                    line_data = await self.api_client.async_get_real_time_data(
-                        stop_id, int(line_id)
-                    )
-                    lines_data[line_id] = line_data
-                except TperApiRealTimeNotAvailableError:
-                    lines_data[line_id] = {"error": "not_available"}
-                except TperApiNoMoreBusesError:
-                    lines_data[line_id] = {"error": "no_more_buses"}
-                except TperApiSystemError:
-                    lines_data[line_id] = {"error": "system_error"}
-                except TperApiError:
-                    lines_data[line_id] = {"error": "api_error"}
-
-        # Update coordinator interval based on bus times
+        # Fetch all lines concurrently; failed lines are retried on their own
+        lines_data_raw = await self.api_client.async_get_multiple_real_time_data(
+            stop_id,
+            line_ids_int,
+            max_concurrent=DEFAULT_MAX_CONCURRENT_REQUESTS,
+            retry_budget=MAX_RETRIES_PER_REFRESH,
+        )
+        
+        lines_data = {}
+        
+        # Process each line's data, mapping classified errors to states
+        for line_id, line_data in lines_data_raw.items():
+            if isinstance(line_data, TperApiError):
+                lines_data[line_id] = {"error": line_data.error_key}
+                self._record_line_failure(line_id, line_data)
+            else:
+                lines_data[line_id] = line_data
+                self._record_line_success(line_id)
+
+        # Forget outcomes for lines that are no longer configured
+        for line_id in self.line_outcomes.keys() - lines_data.keys():
+            del self.line_outcomes[line_id]
+
+        # Merge the refreshed lines into the departure timeline
+        line_names = self.config_entry.options.get(
+            CONF_LINE_NAMES,
+            self.config_entry.data.get(CONF_LINE_NAMES, {})
+        )
+        self.changed_lines = self.timeline.update(lines_data, line_names)
+
+        # Update coordinator interval based on bus times, staggered across entries
         new_interval = self._calculate_dynamic_update_interval(lines_data)
+        if self._scheduler.staggers:
+            new_interval = self._scheduler.align(
+                self.config_entry.entry_id,
+                new_interval,
+                self.polling_policy.floor,
+                self.polling_policy.jitter,
+            )
+        else:
+            new_interval = timedelta(
+                seconds=self.polling_policy.apply_jitter(new_interval.total_seconds())
+            )
         if new_interval != self.update_interval:
             self.update_interval = new_interval
 
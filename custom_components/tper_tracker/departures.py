@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import Any, NamedTuple
+
+
+# Single upcoming departure parsed from cached arrival data
+class Departure(NamedTuple):
+    time: datetime
+    line_id: str
+    line_name: str
+    satellite: Any
+    accessible: Any
+
+
+# Parse time string (HH:MM) to a datetime relative to `now`, handling day rollover
+def parse_time_to_datetime(time_str: str, now: datetime) -> datetime | None:
+    try:
+        time_obj = datetime.strptime(time_str, "%H:%M").time()
+    except ValueError:
+        return None
+
+    # Combine with today's date in the timezone of the reference time
+    bus_datetime = datetime.combine(now.date(), time_obj, tzinfo=now.tzinfo)
+
+    # Roll over to tomorrow for overnight service or significantly past times
+    if bus_datetime < now:
+        if (now.hour >= 22 and time_obj.hour <= 6) or bus_datetime < now - timedelta(minutes=5):
+            bus_datetime += timedelta(days=1)
+
+    return bus_datetime
+
+
+# Earliest upcoming first arrival across the raw data of all lines
+def earliest_departure(lines_data: dict[str, Any], now: datetime) -> datetime | None:
+    earliest_bus_time = None
+
+    for line_data in lines_data.values():
+        if line_data.get("error") or not line_data.get("risultati"):
+            continue
+
+        try:
+            bus_time = parse_time_to_datetime(line_data["risultati"][0]["orario"], now)
+        except (KeyError, IndexError, TypeError):
+            continue
+
+        if bus_time and bus_time > now:
+            if earliest_bus_time is None or bus_time < earliest_bus_time:
+                earliest_bus_time = bus_time
+
+    return earliest_bus_time
+
+
+# Sorted departures of all lines at a stop, rebuilt incrementally per refresh
+class DepartureTimeline:
+    def __init__(self, parse_time: Callable[[str], datetime | None]) -> None:
+        self._parse_time = parse_time
+        self._raw: dict[str, tuple[str | None, list[dict[str, Any]]]] = {}
+        self._lines: dict[str, list[Departure]] = {}
+
+    # Re-parse only the lines whose arrivals or error changed and return their IDs
+    def update(
+        self, lines_data: dict[str, Any], line_names: dict[str, str]
+    ) -> set[str]:
+        changed: set[str] = set()
+
+        for line_id, line_data in lines_data.items():
+            error = line_data.get("error")
+            risultati = [] if error else line_data.get("risultati") or []
+            if line_id in self._lines and self._raw[line_id] == (error, risultati):
+                continue
+
+            self._raw[line_id] = (error, risultati)
+            self._lines[line_id] = self._parse_line(
+                line_id, line_names.get(line_id, line_id), risultati
+            )
+            changed.add(line_id)
+
+        # Drop lines that are no longer configured
+        for line_id in self._lines.keys() - lines_data.keys():
+            del self._lines[line_id]
+            del self._raw[line_id]
+            changed.add(line_id)
+
+        return changed
+
+    # Build the sorted departures of a single line
+    def _parse_line(
+        self, line_id: str, line_name: str, risultati: list[dict[str, Any]]
+    ) -> list[Departure]:
+        departures = []
+        for bus in risultati:
+            if not (orario := bus.get("orario")):
+                continue
+            if (bus_time := self._parse_time(orario)) is None:
+                continue
+            departures.append(
+                Departure(
+                    time=bus_time,
+                    line_id=line_id,
+                    line_name=line_name,
+                    satellite=bus.get("satellite"),
+                    accessible=bus.get("pedana"),
+                )
+            )
+        departures.sort(key=attrgetter("time"))
+        return departures
+
+    # Departures of a single line in arrival order
+    def line(self, line_id: str) -> list[Departure]:
+        return self._lines.get(line_id, [])
+
+    # Error state of a single line, if any
+    def line_error(self, line_id: str) -> str | None:
+        return self._raw[line_id][0] if line_id in self._raw else None
+
+    # IDs of all lines in the timeline
+    @property
+    def line_ids(self) -> list[str]:
+        return list(self._lines)
+
+    # Merge all lines into one sorted stream, optionally bounded to [start, end)
+    def iter_departures(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> Iterator[Departure]:
+        for departure in heapq.merge(*self._lines.values(), key=attrgetter("time")):
+            if start is not None and departure.time < start:
+                continue
+            if end is not None and departure.time >= end:
+                break
+            yield departure
\ No newline at end of file
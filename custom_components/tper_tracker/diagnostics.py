@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_SCHEDULER, DATA_SESSION, DOMAIN
+from .coordinator import TperDataUpdateCoordinator
+
+
+# Diagnostics for a config entry: API error rates, line outcomes and shared request stats
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    coordinator: TperDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    diagnostics: dict[str, Any] = {
+        "options": dict(entry.options),
+        "update_interval": coordinator.update_interval.total_seconds(),
+        "api": coordinator.api_client.error_stats,
+        "lines": {
+            line_id: asdict(outcome)
+            for line_id, outcome in coordinator.line_outcomes.items()
+        },
+    }
+
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is not None:
+        diagnostics["scheduler"] = scheduler.stats
+    if (session_manager := hass.data.get(DATA_SESSION)) is not None:
+        diagnostics["pool"] = session_manager.stats.as_dict()
+
+    return diagnostics
\ No newline at end of file
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
+
+from .const import DOMAIN
+
+
+# Device grouping every entity of a stop, shared by all platforms
+def stop_device_info(stop_id: int | str) -> DeviceInfo:
+    return DeviceInfo(
+        identifiers={(DOMAIN, str(stop_id))},
+        name=f"TPER Tracker #{stop_id}",
+        manufacturer="@ddrimus",
+        model="TPER Tracker",
+    )
+
+
+# Remove a platform's registry entries left over from the other sensor mode
+@callback
+def async_remove_other_mode_entities(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    domain: str,
+    stop_unique_id: str,
+    board_mode: bool,
+) -> None:
+    entity_registry = er.async_get(hass)
+    for registry_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
+        if registry_entry.domain != domain:
+            continue
+        is_stop_level = registry_entry.unique_id == stop_unique_id
+        if is_stop_level != board_mode:
+            entity_registry.async_remove(registry_entry.entity_id)
\ No newline at end of file
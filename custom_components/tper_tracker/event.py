@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import count
+
+from homeassistant.components.event import EventEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .api import TperApiError, TperApiSystemError
+from .const import (
+    CONF_APPROACHING_MINUTES,
+    CONF_ARRIVING_MINUTES,
+    CONF_LINE_IDS,
+    CONF_LINE_NAMES,
+    CONF_SENSOR_MODE,
+    CONF_STOP_ID,
+    DEFAULT_APPROACHING_MINUTES,
+    DEFAULT_ARRIVING_MINUTES,
+    DEFAULT_SENSOR_MODE,
+    DOMAIN,
+    EVENT_MATCH_TOLERANCE,
+    EVENT_TIMER_RESOLUTION,
+    SENSOR_MODE_BOARD,
+)
+from .coordinator import TperDataUpdateCoordinator
+from .departures import Departure
+from .entity import async_remove_other_mode_entities, stop_device_info
+from .timer_wheel import TimerWheel
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_APPROACHING = "approaching"
+EVENT_ARRIVING = "arriving"
+EVENT_DEPARTED = "departed"
+
+# Line errors that say nothing about the buses, so existing timers are kept
+_TRANSIENT_ERRORS = frozenset({TperApiError.error_key, TperApiSystemError.error_key})
+
+
+# Setup function for creating one bus event entity per line, or one per stop in board mode
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    coordinator: TperDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    line_ids = entry.options.get(CONF_LINE_IDS, entry.data.get(CONF_LINE_IDS, []))
+    stop_id = entry.data[CONF_STOP_ID]
+    board_mode = entry.options.get(CONF_SENSOR_MODE, DEFAULT_SENSOR_MODE) == SENSOR_MODE_BOARD
+
+    # One timer wheel per stop, driven by a single Home Assistant timer that
+    # ticks in the event loop, since its actions write entity state
+    @callback
+    def _call_at(when: datetime, action: Callable[[datetime], None]) -> Callable[[], None]:
+        @callback
+        def _run(now: datetime) -> None:
+            action(now)
+
+        return async_track_point_in_utc_time(hass, _run, when)
+
+    wheel = TimerWheel(_call_at, EVENT_TIMER_RESOLUTION)
+    entry.async_on_unload(wheel.cancel_all)
+
+    if board_mode:
+        entities = [TperBusEventEntity(coordinator, entry, wheel)]
+    else:
+        entities = [
+            TperBusEventEntity(coordinator, entry, wheel, line_id) for line_id in line_ids
+        ]
+
+    # Remove registry entries left over from the other sensor mode
+    async_remove_other_mode_entities(
+        hass, entry, "event", f"{DOMAIN}_{stop_id}_events", board_mode
+    )
+
+    async_add_entities(entities)
+
+
+# A predicted bus followed across refreshes, with the events already fired for it
+@dataclass
+class TrackedBus:
+    key: int
+    line_id: str
+    line_name: str
+    time: datetime
+    fired: set[str] = field(default_factory=set)
+
+
+# Event entity firing approaching, arriving and departed events for one line or a whole stop
+class TperBusEventEntity(CoordinatorEntity[TperDataUpdateCoordinator], EventEntity):
+    _attr_icon = "mdi:bus-alert"
+    _attr_has_entity_name = True
+    _attr_event_types = [EVENT_APPROACHING, EVENT_ARRIVING, EVENT_DEPARTED]
+
+    # Initialize event entity with coordinator, config entry, timer wheel and
+    # line ID (None follows every line of the stop)
+    def __init__(
+        self,
+        coordinator: TperDataUpdateCoordinator,
+        entry: ConfigEntry,
+        wheel: TimerWheel,
+        line_id: str | None = None,
+    ) -> None:
+        super().__init__(coordinator)
+        self._wheel = wheel
+        self._line_id = line_id
+        self._tracked: list[TrackedBus] = []
+        self._keys = count()
+        self._primed = False
+
+        stop_id = entry.data[CONF_STOP_ID]
+
+        # Time before the predicted arrival at which each event fires
+        self._offsets = {
+            EVENT_APPROACHING: timedelta(minutes=entry.options.get(
+                CONF_APPROACHING_MINUTES, DEFAULT_APPROACHING_MINUTES
+            )),
+            EVENT_ARRIVING: timedelta(minutes=entry.options.get(
+                CONF_ARRIVING_MINUTES, DEFAULT_ARRIVING_MINUTES
+            )),
+            EVENT_DEPARTED: timedelta(0),
+        }
+
+        if line_id is None:
+            self._attr_translation_key = "stop_events"
+            self._attr_unique_id = f"{DOMAIN}_{stop_id}_events"
+        else:
+            line_names = entry.options.get(CONF_LINE_NAMES, entry.data.get(CONF_LINE_NAMES, {}))
+            self._attr_translation_key = "bus_events"
+            self._attr_unique_id = f"{DOMAIN}_{stop_id}_{line_id}_events"
+            self._attr_translation_placeholders = {
+                "line_name": line_names.get(line_id, line_id)
+            }
+        self._attr_device_info = stop_device_info(stop_id)
+
+    # Schedule timers for the predictions already cached when the entity is added
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._reschedule()
+
+    # Drop this entity's timers from the shared wheel
+    async def async_will_remove_from_hass(self) -> None:
+        for bus in self._tracked:
+            self._cancel(bus)
+        self._tracked = []
+        await super().async_will_remove_from_hass()
+
+    # Reschedule only when the latest refresh changed the followed predictions
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        changed = self.coordinator.changed_lines
+        if (changed and self._line_id is None) or self._line_id in changed:
+            self._reschedule()
+        super()._handle_coordinator_update()
+
+    # Match new predictions to tracked buses and move only the timers whose ETA changed
+    @callback
+    def _reschedule(self) -> None:
+        timeline = self.coordinator.timeline
+        departures: Iterable[Departure]
+        if self._line_id is None:
+            departures = timeline.iter_departures()
+        elif self._line_id in timeline.line_ids:
+            departures = timeline.line(self._line_id)
+        else:
+            return
+
+        # Lines in a transient error keep their buses and timers untouched
+        frozen = {
+            line_id
+            for line_id in timeline.line_ids
+            if timeline.line_error(line_id) in _TRANSIENT_ERRORS
+        }
+
+        now = dt_util.utcnow()
+        tolerance = timedelta(minutes=EVENT_MATCH_TOLERANCE)
+        tracked = [bus for bus in self._tracked if bus.line_id in frozen]
+        unmatched = [bus for bus in self._tracked if bus.line_id not in frozen]
+
+        # Predictions are sorted, so each one takes the closest remaining bus of its line in range
+        for departure in departures:
+            bus = min(
+                (candidate for candidate in unmatched if candidate.line_id == departure.line_id),
+                key=lambda candidate: abs(candidate.time - departure.time),
+                default=None,
+            )
+            if bus is not None and abs(bus.time - departure.time) <= tolerance:
+                unmatched.remove(bus)
+            else:
+                bus = TrackedBus(
+                    next(self._keys), departure.line_id, departure.line_name, departure.time
+                )
+                past_due = [
+                    event_type
+                    for event_type, offset in self._offsets.items()
+                    if departure.time - offset <= now
+                ]
+                # Nothing is replayed at startup; later only the latest passed threshold fires
+                bus.fired.update(past_due if not self._primed else past_due[:-1])
+            bus.time = departure.time
+            tracked.append(bus)
+            self._schedule(bus, departure)
+
+        # A bus that vanished around its arrival time has departed
+        for bus in unmatched:
+            self._cancel(bus)
+            if (
+                EVENT_DEPARTED not in bus.fired
+                and bus.time - self._offsets[EVENT_ARRIVING] <= now
+            ):
+                self._fire(bus, EVENT_DEPARTED, None)
+
+        self._tracked = tracked
+        self._primed = self.coordinator.data is not None
+
+    # Put the pending events of a bus on the wheel; unchanged times are left in place
+    def _schedule(self, bus: TrackedBus, departure: Departure) -> None:
+        for event_type, offset in self._offsets.items():
+            if event_type in bus.fired:
+                continue
+            self._wheel.schedule(
+                (self.unique_id, bus.key, event_type),
+                bus.time - offset,
+                lambda event_type=event_type: self._fire(bus, event_type, departure),
+            )
+
+    # Remove the pending events of a bus from the wheel
+    def _cancel(self, bus: TrackedBus) -> None:
+        for event_type in self._offsets:
+            self._wheel.cancel((self.unique_id, bus.key, event_type))
+
+    # Fire one event for a bus, at most once
+    @callback
+    def _fire(self, bus: TrackedBus, event_type: str, departure: Departure | None) -> None:
+        if event_type in bus.fired:
+            return
+        bus.fired.add(event_type)
+
+        # A departed bus gets no further events, even if it reappears
+        if event_type == EVENT_DEPARTED:
+            bus.fired.update(self._offsets)
+
+        attributes = {
+            "line": bus.line_name,
+            "arrival": bus.time.isoformat(),
+            "minutes": max(0, round((bus.time - dt_util.utcnow()).total_seconds() / 60)),
+        }
+        if departure is not None:
+            attributes["satellite"] = departure.satellite
+            attributes["accessible"] = departure.accessible
+
+        self._trigger_event(event_type, attributes)
+        self.async_write_ha_state()
\ No newline at end of file
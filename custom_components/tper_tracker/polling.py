@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from .const import (
+    CONF_POLLING_JITTER,
+    CONF_POLLING_PRESET,
+    CONF_POLLING_TIERS,
+    DEFAULT_POLLING_JITTER,
+    DEFAULT_POLLING_PRESET,
+    MINIMUM_UPDATE_INTERVAL,
+    POLLING_PRESET_AGGRESSIVE,
+    POLLING_PRESET_BALANCED,
+    POLLING_PRESET_CUSTOM,
+    POLLING_PRESET_FRUGAL,
+    PROJECTION_HEADWAY_MINUTES,
+    UPDATE_INTERVAL,
+)
+from .departures import earliest_departure
+
+
+# Poll every `interval` seconds while the next bus is at most `max_minutes` away
+class PollingTier(NamedTuple):
+    max_minutes: float
+    interval: int
+
+
+# Preset ladders: (tiers, interval beyond the last tier, interval with no bus data)
+POLLING_PRESETS: dict[str, tuple[tuple[PollingTier, ...], int, int]] = {
+    POLLING_PRESET_AGGRESSIVE: (
+        (
+            PollingTier(5, 30),
+            PollingTier(15, 30),
+            PollingTier(30, 60),
+            PollingTier(60, 120),
+            PollingTier(120, 300),
+        ),
+        600,
+        60,
+    ),
+    POLLING_PRESET_BALANCED: (
+        (
+            PollingTier(5, 30),
+            PollingTier(15, 60),
+            PollingTier(30, 120),
+            PollingTier(60, 300),
+            PollingTier(120, 600),
+        ),
+        900,
+        UPDATE_INTERVAL,
+    ),
+    POLLING_PRESET_FRUGAL: (
+        (
+            PollingTier(5, 60),
+            PollingTier(15, 120),
+            PollingTier(30, 300),
+            PollingTier(60, 600),
+            PollingTier(120, 900),
+        ),
+        1800,
+        300,
+    ),
+}
+
+
+# Parse custom tiers written as "5:30, 15:60, 30:120, 900" (last bare value is the fallback),
+# rejecting intervals the policy would otherwise clamp to its floor
+def parse_tiers(text: str) -> tuple[tuple[PollingTier, ...], int]:
+    tiers: list[PollingTier] = []
+    fallback: int | None = None
+
+    for part in (item.strip() for item in text.split(",")):
+        if not part:
+            continue
+        if fallback is not None:
+            raise ValueError("The fallback interval must be the last value")
+        if ":" in part:
+            minutes_str, interval_str = part.split(":", 1)
+            tier = PollingTier(float(minutes_str), int(interval_str))
+            if not math.isfinite(tier.max_minutes) or tier.max_minutes <= 0:
+                raise ValueError(f"Invalid polling tier: {part}")
+            if tier.interval < MINIMUM_UPDATE_INTERVAL:
+                raise ValueError(
+                    f"Polling interval below {MINIMUM_UPDATE_INTERVAL} seconds: {part}"
+                )
+            if tiers and tier.max_minutes <= tiers[-1].max_minutes:
+                raise ValueError("Polling tiers must be in increasing ETA order")
+            tiers.append(tier)
+        else:
+            fallback = int(part)
+            if fallback < MINIMUM_UPDATE_INTERVAL:
+                raise ValueError(f"Invalid fallback interval: {part}")
+
+    if not tiers:
+        raise ValueError("At least one polling tier is required")
+    return tuple(tiers), fallback if fallback is not None else tiers[-1].interval
+
+
+# Format tiers back into the text accepted by parse_tiers
+def format_tiers(tiers: tuple[PollingTier, ...], fallback: int) -> str:
+    parts = [f"{tier.max_minutes:g}:{tier.interval}" for tier in tiers]
+    parts.append(str(fallback))
+    return ", ".join(parts)
+
+
+# Adaptive polling policy mapping time-to-next-bus to an update interval
+class PollingPolicy:
+    def __init__(
+        self,
+        tiers: tuple[PollingTier, ...],
+        fallback_interval: int,
+        idle_interval: int,
+        jitter: float = 0.0,
+        floor: int = MINIMUM_UPDATE_INTERVAL,
+    ) -> None:
+        self.tiers = tiers
+        self.fallback_interval = fallback_interval
+        self.idle_interval = idle_interval
+        self.jitter = jitter
+        self.floor = floor
+
+    # Build the policy for a config entry's options
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> PollingPolicy:
+        preset = options.get(CONF_POLLING_PRESET, DEFAULT_POLLING_PRESET)
+        jitter = options.get(CONF_POLLING_JITTER, DEFAULT_POLLING_JITTER) / 100
+
+        if preset == POLLING_PRESET_CUSTOM and (text := options.get(CONF_POLLING_TIERS)):
+            tiers, fallback = parse_tiers(text)
+            idle = UPDATE_INTERVAL
+        else:
+            tiers, fallback, idle = POLLING_PRESETS.get(
+                preset, POLLING_PRESETS[DEFAULT_POLLING_PRESET]
+            )
+
+        return cls(tiers, fallback, idle, jitter=jitter)
+
+    # Base interval in seconds for the given minutes until the next bus (None = no data)
+    def interval_for(self, minutes_until_bus: float | None) -> float:
+        if minutes_until_bus is None:
+            return max(self.floor, self.idle_interval)
+
+        for tier in self.tiers:
+            if minutes_until_bus <= tier.max_minutes:
+                return max(self.floor, tier.interval)
+        return max(self.floor, self.fallback_interval)
+
+    # Randomly spread an interval by the configured jitter, never below the floor
+    def apply_jitter(self, seconds: float) -> float:
+        if self.jitter <= 0:
+            return seconds
+        spread = seconds * self.jitter
+        return max(self.floor, seconds + random.uniform(-spread, spread))
+
+    # Dry run: estimated API calls per day for a stop with evenly spaced buses
+    def projected_calls_per_day(
+        self, line_count: int, headway_minutes: float = PROJECTION_HEADWAY_MINUTES
+    ) -> int:
+        headway = headway_minutes * 60
+        elapsed = 0.0
+        refreshes = 0
+
+        while elapsed < 86400:
+            minutes_until_bus = (headway - elapsed % headway) / 60
+            elapsed += self.interval_for(minutes_until_bus)
+            refreshes += 1
+
+        return refreshes * line_count
+
+
+# Base interval in seconds before a stop's next refresh, from the time until its earliest bus
+def next_interval(lines_data: dict[str, Any], now: datetime, policy: PollingPolicy) -> float:
+    earliest_bus_time = earliest_departure(lines_data, now)
+
+    minutes_until_bus = None
+    if earliest_bus_time is not None:
+        minutes_until_bus = (earliest_bus_time - now).total_seconds() / 60
+
+    return policy.interval_for(minutes_until_bus)
\ No newline at end of file
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import logging
+import math
+import random
+import time
+from datetime import timedelta
+from typing import Any
+
+from .api import RateLimiter
+from .const import (
+    ALIGN_TOLERANCE,
+    REFRESH_BURST_WINDOW,
+    STARTUP_BURST,
+    STARTUP_SPACING,
+    STARTUP_WINDOW,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# Domain-wide scheduler giving each coordinator its own phase within every interval
+class TperRefreshScheduler:
+    def __init__(self) -> None:
+        self.rate_limiter = RateLimiter()
+        self._entry_ids: list[str] = []
+        self._projected_calls: dict[str, int] = {}
+        self._burst_started = 0.0
+        self._burst_size = 0
+        self._bursts = 0
+        self._burst_total = 0
+        self._max_burst = 0
+        self._startups = 0
+        self._last_startup = 0.0
+
+    # Add a coordinator's entry to the phase rotation with its projected daily API calls
+    def register(self, entry_id: str, projected_calls_per_day: int = 0) -> None:
+        capacity = self.rate_limiter.calls_per_second
+        was_over = self.projected_call_rate > capacity
+        if entry_id not in self._entry_ids:
+            self._entry_ids.append(entry_id)
+        self._projected_calls[entry_id] = projected_calls_per_day
+
+        # The shared limiter stretches every refresh once the entries need more than it allows
+        if self.projected_call_rate > capacity and not was_over:
+            _LOGGER.warning(
+                "Configured stops are projected to need %.2f WebBus calls per second, "
+                "above the shared limit of %.2f; refreshes will be slower than their "
+                "polling profiles. Use a less frequent polling profile or fewer lines",
+                self.projected_call_rate, capacity
+            )
+
+    # Remove an entry from the phase rotation
+    def unregister(self, entry_id: str) -> None:
+        if entry_id in self._entry_ids:
+            self._entry_ids.remove(entry_id)
+        self._projected_calls.pop(entry_id, None)
+
+    # Average API calls per second projected for all registered entries
+    @property
+    def projected_call_rate(self) -> float:
+        return sum(self._projected_calls.values()) / 86400
+
+    # True when no coordinator is registered anymore
+    @property
+    def is_empty(self) -> bool:
+        return not self._entry_ids
+
+    # Offset in seconds of an entry within an interval, spread evenly across entries
+    def phase(self, entry_id: str, interval_seconds: float) -> float:
+        if entry_id not in self._entry_ids:
+            return 0.0
+        return interval_seconds * self._entry_ids.index(entry_id) / len(self._entry_ids)
+
+    # True when several coordinators share the rotation and need staggering
+    @property
+    def staggers(self) -> bool:
+        return len(self._entry_ids) > 1
+
+    # Delay until the entry's first phase-shifted slot at least ~one interval away,
+    # jittered by a fraction of the interval but never past half the phase spacing
+    def align(
+        self,
+        entry_id: str,
+        interval: timedelta,
+        floor: float = 0.0,
+        jitter: float = 0.0,
+    ) -> timedelta:
+        interval_seconds = interval.total_seconds()
+        if interval_seconds <= 0 or not self.staggers:
+            return interval
+
+        now = time.time()
+        phase = self.phase(entry_id, interval_seconds)
+        earliest = now + interval_seconds * ALIGN_TOLERANCE
+        slot = math.ceil((earliest - phase) / interval_seconds)
+        delay = slot * interval_seconds + phase - now
+
+        if jitter > 0:
+            spread = min(interval_seconds * jitter, interval_seconds / len(self._entry_ids) / 2)
+            delay += random.uniform(-spread, spread)
+        return timedelta(seconds=max(floor, delay))
+
+    # Delay before an entry's first refresh, spacing out setups that arrive together
+    def startup_delay(self) -> float:
+        now = time.monotonic()
+        if now - self._last_startup > STARTUP_WINDOW:
+            self._startups = 0
+        self._last_startup = now
+        self._startups += 1
+        return max(0, self._startups - STARTUP_BURST) * STARTUP_SPACING
+
+    # Record a refresh start to measure how many refreshes fire together
+    def record_refresh(self, entry_id: str) -> None:
+        now = time.monotonic()
+        if self._burst_size and now - self._burst_started <= REFRESH_BURST_WINDOW:
+            self._burst_size += 1
+        else:
+            self._close_burst()
+            self._burst_started = now
+            self._burst_size = 1
+
+        if self._burst_size > 1:
+            _LOGGER.debug(
+                "Refresh of %s is part of a burst of %d refreshes",
+                entry_id, self._burst_size
+            )
+
+    # Fold the current burst into the aggregate statistics
+    def _close_burst(self) -> None:
+        if not self._burst_size:
+            return
+        self._bursts += 1
+        self._burst_total += self._burst_size
+        self._max_burst = max(self._max_burst, self._burst_size)
+
+    # Burst size and rate limiter queue wait statistics
+    @property
+    def stats(self) -> dict[str, Any]:
+        bursts = self._bursts + (1 if self._burst_size else 0)
+        total = self._burst_total + self._burst_size
+        return {
+            "coordinators": len(self._entry_ids),
+            "projected_call_rate": self.projected_call_rate,
+            "bursts": bursts,
+            "mean_burst": total / bursts if bursts else 0.0,
+            "max_burst": max(self._max_burst, self._burst_size),
+            "rate_limiter": self.rate_limiter.stats,
+        }
\ No newline at end of file
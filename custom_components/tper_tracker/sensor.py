@@ -1,27 +1,51 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
+from itertools import islice
 from typing import Any
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    BOARD_MAX_DEPARTURES,
     CONF_LINE_IDS,
     CONF_LINE_NAMES,
+    CONF_SENSOR_MODE,
     CONF_STOP_ID,
+    DEFAULT_SENSOR_MODE,
     DOMAIN,
+    SENSOR_MODE_BOARD,
 )
 from .coordinator import TperDataUpdateCoordinator
+from .departures import Departure, parse_time_to_datetime
+from .entity import async_remove_other_mode_entities, stop_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+# Attributes rewritten on every refresh, kept out of the recorder
+VOLATILE_LINE_ATTRIBUTES = frozenset({
+    "last_update",
+    *(
+        f"next_bus_{index}_{field}"
+        for index in range(1, 4)
+        for field in ("time", "satellite", "accessible")
+    ),
+})
+
+# Satellite values that mean the bus is not GPS tracked
+_NOT_TRACKED_VALUES = frozenset({"", "0", "false", "no", "n"})
+
 
 # Setup function for creating sensor entities
 async def async_setup_entry(
@@ -33,11 +57,25 @@ async def async_setup_entry(
     coordinator: TperDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     line_ids = entry.options.get(CONF_LINE_IDS, entry.data.get(CONF_LINE_IDS, []))
     
-    # Create sensor entity for each configured bus line
-    entities = [
-        TperTrackerSensor(coordinator, entry, line_id)
-        for line_id in line_ids
-    ]
+    stop_id = entry.data[CONF_STOP_ID]
+    board_mode = entry.options.get(CONF_SENSOR_MODE, DEFAULT_SENSOR_MODE) == SENSOR_MODE_BOARD
+    
+    # Create one departure board or a sensor entity for each configured bus line
+    if board_mode:
+        entities = [TperDepartureBoardSensor(coordinator, entry)]
+    else:
+        entities = []
+        for line_id in line_ids:
+            entities.extend([
+                TperTrackerSensor(coordinator, entry, line_id),
+                TperMinutesToArrivalSensor(coordinator, entry, line_id),
+                TperGpsTrackedSensor(coordinator, entry, line_id),
+            ])
+    
+    # Remove registry entries left over from the other sensor mode
+    async_remove_other_mode_entities(
+        hass, entry, "sensor", f"{DOMAIN}_{stop_id}_board", board_mode
+    )
     
     async_add_entities(entities)
 
@@ -47,6 +85,7 @@ class TperTrackerSensor(CoordinatorEntity[TperDataUpdateCoordinator], SensorEnti
     _attr_translation_key = "bus_line"
     _attr_icon = "mdi:bus-stop"
     _attr_has_entity_name = True
+    _unrecorded_attributes = VOLATILE_LINE_ATTRIBUTES
 
     # Initialize sensor with coordinator, config entry, and line ID
     def __init__(
@@ -74,12 +113,7 @@ class TperTrackerSensor(CoordinatorEntity[TperDataUpdateCoordinator], SensorEnti
         }
         
         # Configure device information for grouping sensors
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, str(stop_id))},
-            name=f"TPER Tracker #{stop_id}",
-            manufacturer="@ddrimus",
-            model="TPER Tracker",
-        )
+        self._attr_device_info = stop_device_info(stop_id)
 
     # Return the sensor's native value (next bus time or error state)
     @property
@@ -169,24 +203,134 @@ class TperTrackerSensor(CoordinatorEntity[TperDataUpdateCoordinator], SensorEnti
 
     # Parse time string to datetime with proper date handling
     def _parse_time_to_datetime(self, time_str: str) -> datetime | None:
-        try:
-            time_obj = datetime.strptime(time_str, "%H:%M").time()
-            now = dt_util.now()
-            today = now.date()
-            
-            # Create datetime object with local timezone
-            bus_datetime = dt_util.as_local(datetime.combine(today, time_obj))
-            
-            # Handle day rollover for past times or overnight service
-            if bus_datetime < now:
-                current_hour = now.hour
-                bus_hour = time_obj.hour
-                
-                # Check for overnight service transition or significantly past times
-                if (current_hour >= 22 and bus_hour <= 6) or bus_datetime < now - timedelta(minutes=5):
-                    bus_datetime += timedelta(days=1)
-            
-            return bus_datetime
-        except ValueError:
+        bus_datetime = parse_time_to_datetime(time_str, dt_util.now())
+        if bus_datetime is None:
             _LOGGER.warning("Failed to parse time '%s' for sensor %s", time_str, self._attr_unique_id)
-            return None
\ No newline at end of file
+        return bus_datetime
+
+
+# Base class for compact numeric per-line sensors suited to long-term statistics
+class TperLineStatisticSensor(CoordinatorEntity[TperDataUpdateCoordinator], SensorEntity):
+    _attr_has_entity_name = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_registry_enabled_default = False
+    _unique_id_suffix: str
+
+    # Initialize sensor with coordinator, config entry, and line ID
+    def __init__(
+        self,
+        coordinator: TperDataUpdateCoordinator,
+        entry: ConfigEntry,
+        line_id: str
+    ) -> None:
+        super().__init__(coordinator)
+        self._line_id = line_id
+        
+        line_names = entry.options.get(CONF_LINE_NAMES, entry.data.get(CONF_LINE_NAMES, {}))
+        stop_id = entry.data[CONF_STOP_ID]
+        
+        self._attr_unique_id = f"{DOMAIN}_{stop_id}_{line_id}_{self._unique_id_suffix}"
+        self._attr_translation_placeholders = {
+            "line_name": line_names.get(line_id, line_id),
+        }
+        self._attr_device_info = stop_device_info(stop_id)
+
+    # Next departure of this line from the coordinator's timeline
+    def _next_departure(self) -> Departure | None:
+        now = dt_util.now()
+        return next(
+            (
+                departure
+                for departure in self.coordinator.timeline.line(self._line_id)
+                if departure.time >= now
+            ),
+            None,
+        )
+
+
+# Minutes until the next bus of a line
+class TperMinutesToArrivalSensor(TperLineStatisticSensor):
+    _attr_translation_key = "minutes_to_arrival"
+    _attr_icon = "mdi:timer-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _unique_id_suffix = "minutes"
+
+    # Return whole minutes until the next bus, or None without data
+    @property
+    def native_value(self) -> int | None:
+        if departure := self._next_departure():
+            return int((departure.time - dt_util.now()).total_seconds() // 60)
+        return None
+
+
+# Whether the next bus of a line is GPS tracked, as 1 or 0
+class TperGpsTrackedSensor(TperLineStatisticSensor):
+    _attr_translation_key = "gps_tracked"
+    _attr_icon = "mdi:satellite-variant"
+    _unique_id_suffix = "gps"
+
+    # Return 1 when the next bus is tracked by satellite, 0 otherwise
+    @property
+    def native_value(self) -> int | None:
+        if departure := self._next_departure():
+            satellite = str(departure.satellite or "").strip().lower()
+            return int(satellite not in _NOT_TRACKED_VALUES)
+        return None
+
+
+# Single sensor per stop listing the upcoming departures of all lines
+class TperDepartureBoardSensor(CoordinatorEntity[TperDataUpdateCoordinator], SensorEntity):
+    _attr_translation_key = "departure_board"
+    _attr_icon = "mdi:bus-clock"
+    _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _unrecorded_attributes = frozenset({"departures"})
+
+    # Initialize board with coordinator and config entry
+    def __init__(self, coordinator: TperDataUpdateCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+        stop_id = entry.data[CONF_STOP_ID]
+        
+        self._attr_unique_id = f"{DOMAIN}_{stop_id}_board"
+        self._attr_device_info = stop_device_info(stop_id)
+        self._update_from_timeline()
+
+    # Rebuild the board once per coordinator refresh
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_from_timeline()
+        super()._handle_coordinator_update()
+
+    # Build state and compact departures attribute from the merged timeline
+    def _update_from_timeline(self) -> None:
+        upcoming = list(islice(
+            self.coordinator.timeline.iter_departures(start=dt_util.now()),
+            BOARD_MAX_DEPARTURES,
+        ))
+        departures = [
+            {
+                "line": departure.line_name,
+                "time": departure.time.strftime("%H:%M"),
+                "gps": departure.satellite,
+                "accessible": departure.accessible,
+            }
+            for departure in upcoming
+        ]
+        
+        # Report lines in error state by name
+        line_names = self._entry.options.get(
+            CONF_LINE_NAMES, self._entry.data.get(CONF_LINE_NAMES, {})
+        )
+        lines_data = (self.coordinator.data or {}).get("lines", {})
+        errors = {
+            line_names.get(line_id, line_id): error
+            for line_id, line_data in lines_data.items()
+            if (error := line_data.get("error"))
+        }
+        
+        self._attr_native_value = upcoming[0].time if upcoming else None
+        self._attr_extra_state_attributes = {"departures": departures}
+        if errors:
+            self._attr_extra_state_attributes["errors"] = errors
\ No newline at end of file
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import logging
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionCreateStartParams,
+    TraceConnectionReuseconnParams,
+)
+
+from .api import REQUEST_TIMEOUT
+from .const import (
+    POOL_DNS_CACHE_TTL,
+    POOL_KEEPALIVE_TIMEOUT,
+    POOL_LIMIT,
+    POOL_LIMIT_PER_HOST,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# Connection pool metrics collected through aiohttp request tracing
+class PoolStats:
+    def __init__(self) -> None:
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.connect_time_total = 0.0
+        self.connect_time_max = 0.0
+
+    # Build the trace config feeding these metrics
+    def trace_config(self) -> TraceConfig:
+        trace_config = TraceConfig()
+        trace_config.on_connection_create_start.append(self._on_create_start)
+        trace_config.on_connection_create_end.append(self._on_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_reuseconn)
+        return trace_config
+
+    async def _on_create_start(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionCreateStartParams,
+    ) -> None:
+        context.connect_started = time.monotonic()
+
+    async def _on_create_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionCreateEndParams,
+    ) -> None:
+        connect_time = time.monotonic() - context.connect_started
+        self.new_connections += 1
+        self.connect_time_total += connect_time
+        self.connect_time_max = max(self.connect_time_max, connect_time)
+
+    async def _on_reuseconn(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionReuseconnParams,
+    ) -> None:
+        self.reused_connections += 1
+
+    # Snapshot of reused vs new connections and connect times
+    def as_dict(self) -> dict[str, Any]:
+        total = self.new_connections + self.reused_connections
+        return {
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "reuse_ratio": self.reused_connections / total if total else 0.0,
+            "mean_connect_time": (
+                self.connect_time_total / self.new_connections
+                if self.new_connections
+                else 0.0
+            ),
+            "max_connect_time": self.connect_time_max,
+        }
+
+
+# Integration-owned HTTP session for WebBus, shared by entries and closed with the last one
+class TperSessionManager:
+    def __init__(self) -> None:
+        self.stats = PoolStats()
+        self._session: ClientSession | None = None
+        self._entry_ids: set[str] = set()
+
+    # Return the shared session for an entry, creating it on first use
+    def acquire(self, entry_id: str) -> ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit=POOL_LIMIT,
+                    limit_per_host=POOL_LIMIT_PER_HOST,
+                    ttl_dns_cache=POOL_DNS_CACHE_TTL,
+                    keepalive_timeout=POOL_KEEPALIVE_TIMEOUT,
+                ),
+                timeout=REQUEST_TIMEOUT,
+                trace_configs=[self.stats.trace_config()],
+            )
+        self._entry_ids.add(entry_id)
+        return self._session
+
+    # Release an entry's use of the session, closing it when no entry is left
+    async def async_release(self, entry_id: str) -> None:
+        self._entry_ids.discard(entry_id)
+        if not self._entry_ids:
+            await self.async_close()
+
+    # Close the session if it is open
+    async def async_close(self) -> None:
+        if self._session is None:
+            return
+
+        _LOGGER.debug("Closing WebBus session, pool stats: %s", self.stats.as_dict())
+        await self._session.close()
+        self._session = None
\ No newline at end of file
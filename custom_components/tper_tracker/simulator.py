@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import argparse
+import time as perf_time
+from bisect import bisect_left
+from collections import Counter
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Any, NamedTuple
+from zoneinfo import ZoneInfo
+
+from .const import CONF_POLLING_PRESET, DEFAULT_POLLING_PRESET
+from .departures import parse_time_to_datetime
+from .polling import POLLING_PRESETS, PollingPolicy, next_interval
+
+
+# Clock whose time only moves when advanced, usable wherever dt_util.now is injected
+class VirtualClock:
+    def __init__(self, start: datetime) -> None:
+        self._tz = start.tzinfo
+        self._utc = start.astimezone(timezone.utc)
+
+    # Current virtual time in the start time's timezone
+    def now(self) -> datetime:
+        return self._utc.astimezone(self._tz)
+
+    # Advance by real elapsed seconds, so DST changes shift the wall clock correctly
+    def advance(self, seconds: float) -> None:
+        self._utc += timedelta(seconds=seconds)
+
+
+# Outcome of a simulated day for one stop
+class SimulationResult(NamedTuple):
+    hour_starts: list[datetime]
+    calls_per_hour: list[int]
+    parses: dict[str, int]
+    wrong_day_parses: dict[str, int]
+    stale_seconds: dict[str, float]
+    max_stale_seconds: dict[str, float]
+
+    # Total API calls over the simulated period
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls_per_hour)
+
+
+# Build a synthetic timetable of evenly spaced departures, wrapping past midnight
+def build_timetable(
+    service_date: date,
+    tz: tzinfo,
+    first: time,
+    last: time,
+    headway_minutes: float,
+) -> list[datetime]:
+    start = datetime.combine(service_date, first, tzinfo=tz)
+    end = datetime.combine(service_date, last, tzinfo=tz)
+    if end <= start:
+        end += timedelta(days=1)
+
+    departures = []
+    current = start
+    while current <= end:
+        departures.append(current)
+        current += timedelta(minutes=headway_minutes)
+    return departures
+
+
+# Run the coordinator's scheduling and time parsing over synthetic timetables
+def simulate(
+    timetables: dict[str, list[datetime]],
+    start: datetime,
+    policy: PollingPolicy,
+    hours: int = 24,
+    results_per_line: int = 3,
+    listed_after_departure: timedelta = timedelta(minutes=1),
+) -> SimulationResult:
+    clock = VirtualClock(start)
+    start_utc = start.astimezone(timezone.utc)
+    end = start_utc + timedelta(hours=hours)
+    hour_starts = [
+        (start_utc + timedelta(hours=hour)).astimezone(start.tzinfo) for hour in range(hours)
+    ]
+    calls_per_hour = [0] * hours
+    parses: Counter[str] = Counter()
+    wrong_day: Counter[str] = Counter()
+    stale: dict[str, float] = dict.fromkeys(timetables, 0.0)
+    max_stale: dict[str, float] = dict.fromkeys(timetables, 0.0)
+    schedules = {line_id: sorted(times) for line_id, times in timetables.items()}
+
+    while (now := clock.now()).astimezone(timezone.utc) < end:
+        hour = int((now.astimezone(timezone.utc) - start_utc).total_seconds() // 3600)
+        lines_data: dict[str, Any] = {}
+        shown: dict[str, datetime | None] = {}
+
+        # Answer one real-time request per line like WebBus would
+        for line_id, times in schedules.items():
+            calls_per_hour[hour] += 1
+            first = bisect_left(times, now - listed_after_departure)
+            upcoming = times[first:first + results_per_line]
+            if not upcoming:
+                lines_data[line_id] = {"error": "no_more_buses"}
+                shown[line_id] = None
+                continue
+
+            lines_data[line_id] = {
+                "risultati": [
+                    {"orario": departure.strftime("%H:%M")} for departure in upcoming
+                ]
+            }
+
+            # Compare parsed datetimes with the true departures
+            for index, departure in enumerate(upcoming):
+                parsed = parse_time_to_datetime(departure.strftime("%H:%M"), now)
+                parses[line_id] += 1
+                if parsed is None or parsed.date() != departure.date():
+                    wrong_day[line_id] += 1
+                if index == 0:
+                    shown[line_id] = parsed
+
+        # Pick the next interval with the coordinator's own helper
+        interval = next_interval(lines_data, now, policy)
+
+        # Staleness: time until the next poll during which the shown bus has already left
+        next_poll = now + timedelta(seconds=interval)
+        for line_id, next_bus in shown.items():
+            if next_bus is None or next_bus >= next_poll:
+                continue
+            stale_for = (next_poll - max(next_bus, now)).total_seconds()
+            stale[line_id] += stale_for
+            max_stale[line_id] = max(max_stale[line_id], stale_for)
+
+        clock.advance(interval)
+
+    return SimulationResult(
+        hour_starts=hour_starts,
+        calls_per_hour=calls_per_hour,
+        parses=dict(parses),
+        wrong_day_parses={line_id: wrong_day[line_id] for line_id in timetables},
+        stale_seconds=stale,
+        max_stale_seconds=max_stale,
+    )
+
+
+# Format a simulation result as a plain text report
+def format_report(result: SimulationResult) -> str:
+    lines = [f"Total calls: {result.total_calls}", "Calls per hour (local start time):"]
+    lines.extend(
+        f"  {hour_start:%Y-%m-%d %H:%M %Z}: {calls}"
+        for hour_start, calls in zip(result.hour_starts, result.calls_per_hour)
+    )
+    lines.append("Per line (parses, wrong-day parses, stale seconds total/max):")
+    lines.extend(
+        f"  {line_id}: {result.parses.get(line_id, 0)}, "
+        f"{result.wrong_day_parses[line_id]}, "
+        f"{result.stale_seconds[line_id]:.0f}/{result.max_stale_seconds[line_id]:.0f}"
+        for line_id in result.wrong_day_parses
+    )
+    return "\n".join(lines)
+
+
+# Parse a "line=headway@HH:MM-HH:MM" timetable argument
+def _parse_line_arg(value: str) -> tuple[str, float, time, time]:
+    try:
+        line_id, rest = value.split("=")
+        headway, hours = rest.split("@")
+        first, last = hours.split("-")
+        return (
+            line_id,
+            float(headway),
+            time.fromisoformat(first),
+            time.fromisoformat(last),
+        )
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Expected line=headway@HH:MM-HH:MM, got {value!r}"
+        ) from None
+
+
+# Command line entry point; the defaults replay a day across the October DST change
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Simulate a day of TPER Tracker polling")
+    parser.add_argument("--date", type=date.fromisoformat, default=date(2026, 10, 25))
+    parser.add_argument("--start", type=time.fromisoformat, default=time(0, 0))
+    parser.add_argument("--tz", default="Europe/Rome")
+    parser.add_argument("--hours", type=int, default=24)
+    parser.add_argument(
+        "--preset", choices=sorted(POLLING_PRESETS), default=DEFAULT_POLLING_PRESET
+    )
+    parser.add_argument(
+        "--listed-after",
+        type=float,
+        default=1.0,
+        help="minutes a bus stays listed after its departure",
+    )
+    parser.add_argument(
+        "--line",
+        type=_parse_line_arg,
+        action="append",
+        help="timetable as line=headway@HH:MM-HH:MM (repeatable)",
+    )
+    args = parser.parse_args(argv)
+
+    tz = ZoneInfo(args.tz)
+    lines = args.line or [
+        ("12", 12.0, time(5, 30), time(0, 40)),
+        ("20", 20.0, time(6, 0), time(23, 10)),
+    ]
+    timetables = {
+        line_id: build_timetable(args.date, tz, first, last, headway)
+        for line_id, headway, first, last in lines
+    }
+
+    started = perf_time.perf_counter()
+    result = simulate(
+        timetables,
+        datetime.combine(args.date, args.start, tzinfo=tz),
+        PollingPolicy.from_options({CONF_POLLING_PRESET: args.preset}),
+        hours=args.hours,
+        listed_after_departure=timedelta(minutes=args.listed_after),
+    )
+    print(format_report(result))
+    print(f"Simulated in {perf_time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import heapq
+import logging
+from collections.abc import Callable, Hashable
+from datetime import datetime, timezone
+
+_LOGGER = logging.getLogger(__name__)
+
+# Schedules a callback at a UTC time and returns a function cancelling it
+CallAt = Callable[[datetime, Callable[[datetime], None]], Callable[[], None]]
+
+
+# Hashed timer wheel: keyed timers bucketed per slot, driven by a single scheduled tick
+class TimerWheel:
+    def __init__(self, call_at: CallAt, resolution: float = 1.0) -> None:
+        self._call_at = call_at
+        self._resolution = resolution
+        self._slots: dict[int, dict[Hashable, Callable[[], None]]] = {}
+        self._timers: dict[Hashable, int] = {}
+        self._heap: list[int] = []
+        self._tick_slot: int | None = None
+        self._cancel_tick: Callable[[], None] | None = None
+
+    # Number of pending timers
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    # Slot index of a point in time
+    def _slot(self, when: datetime) -> int:
+        return int(when.timestamp() // self._resolution)
+
+    # Schedule or move a keyed timer; a timer already in the same slot is left untouched
+    def schedule(self, key: Hashable, when: datetime, action: Callable[[], None]) -> None:
+        slot = self._slot(when)
+        current = self._timers.get(key)
+        if current == slot:
+            self._slots[slot][key] = action
+            return
+        if current is not None:
+            self._remove(key, current)
+
+        self._timers[key] = slot
+        if slot not in self._slots:
+            self._slots[slot] = {}
+            heapq.heappush(self._heap, slot)
+        self._slots[slot][key] = action
+        self._arm()
+
+    # Cancel a keyed timer if pending
+    def cancel(self, key: Hashable) -> None:
+        if (slot := self._timers.get(key)) is not None:
+            self._remove(key, slot)
+            self._arm()
+
+    # Cancel every timer and the scheduled tick
+    def cancel_all(self) -> None:
+        self._slots.clear()
+        self._timers.clear()
+        self._heap.clear()
+        self._disarm()
+
+    # Detach a key from its slot, dropping the slot when it becomes empty
+    def _remove(self, key: Hashable, slot: int) -> None:
+        del self._timers[key]
+        bucket = self._slots[slot]
+        del bucket[key]
+        if not bucket:
+            del self._slots[slot]
+
+    # Earliest slot that still holds timers, discarding emptied slots lazily
+    def _next_slot(self) -> int | None:
+        while self._heap and self._heap[0] not in self._slots:
+            heapq.heappop(self._heap)
+        return self._heap[0] if self._heap else None
+
+    # Make sure the single tick is scheduled for the earliest pending slot
+    def _arm(self) -> None:
+        slot = self._next_slot()
+        if slot == self._tick_slot:
+            return
+        self._disarm()
+        if slot is None:
+            return
+        self._tick_slot = slot
+        self._cancel_tick = self._call_at(
+            datetime.fromtimestamp(slot * self._resolution, timezone.utc), self._tick
+        )
+
+    # Cancel the scheduled tick
+    def _disarm(self) -> None:
+        if self._cancel_tick is not None:
+            self._cancel_tick()
+        self._cancel_tick = None
+        self._tick_slot = None
+
+    # Fire every timer whose slot is due, then re-arm for the next one
+    def _tick(self, now: datetime) -> None:
+        self._cancel_tick = None
+        self._tick_slot = None
+        current = self._slot(now)
+
+        while (slot := self._next_slot()) is not None and slot <= current:
+            heapq.heappop(self._heap)
+            for key, action in self._slots.pop(slot).items():
+                del self._timers[key]
+                try:
+                    action()
+                except Exception:
+                    _LOGGER.exception("Error running timer %s", key)
+
+        self._arm()
\ No newline at end of file
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import CONF_STOP_ID, DOMAIN, SIGNAL_COORDINATOR_ADDED
+from .coordinator import TperDataUpdateCoordinator
+from .departures import DepartureTimeline
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# Register the integration's websocket commands
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+# Serialize the departures and error state of a single line
+def _line_payload(timeline: DepartureTimeline, line_id: str) -> dict[str, Any] | None:
+    if line_id not in timeline.line_ids:
+        return None
+    return {
+        "error": timeline.line_error(line_id),
+        "departures": [
+            {
+                "line": departure.line_name,
+                "time": departure.time.isoformat(),
+                "gps": departure.satellite,
+                "accessible": departure.accessible,
+            }
+            for departure in timeline.line(line_id)
+        ],
+    }
+
+
+# Serialize the given lines of a coordinator's timeline (None marks a removed line)
+def _lines_payload(
+    coordinator: TperDataUpdateCoordinator, line_ids: Iterable[str]
+) -> dict[str, dict[str, Any] | None]:
+    return {
+        line_id: _line_payload(coordinator.timeline, line_id)
+        for line_id in line_ids
+    }
+
+
+# Subscribe to parsed arrivals: an initial snapshot, then per-line deltas
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Optional("stop_ids"): [vol.Coerce(int)],
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    stop_ids: set[int] | None = set(msg["stop_ids"]) if "stop_ids" in msg else None
+    unsubs: dict[str, Callable[[], None]] = {}
+
+    # Send the full state of one stop to the client
+    @callback
+    def send_snapshot(coordinator: TperDataUpdateCoordinator) -> None:
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"],
+                {
+                    "type": "snapshot",
+                    "stop_id": coordinator.config_entry.data[CONF_STOP_ID],
+                    "lines": _lines_payload(coordinator, coordinator.timeline.line_ids),
+                },
+            )
+        )
+
+    # Start following a coordinator, replacing any previous one of the same entry
+    @callback
+    def track(coordinator: TperDataUpdateCoordinator) -> None:
+        entry_id = coordinator.config_entry.entry_id
+        if stop_ids is not None and coordinator.config_entry.data[CONF_STOP_ID] not in stop_ids:
+            return
+        if unsub := unsubs.pop(entry_id, None):
+            unsub()
+
+        # Push only the lines changed by the latest successful refresh
+        @callback
+        def send_delta() -> None:
+            if not coordinator.last_update_success or not coordinator.changed_lines:
+                return
+            connection.send_message(
+                websocket_api.event_message(
+                    msg["id"],
+                    {
+                        "type": "delta",
+                        "stop_id": coordinator.config_entry.data[CONF_STOP_ID],
+                        "lines": _lines_payload(coordinator, coordinator.changed_lines),
+                    },
+                )
+            )
+
+        unsubs[entry_id] = coordinator.async_add_listener(send_delta)
+        send_snapshot(coordinator)
+
+    # Follow coordinators set up (or reloaded) after the subscription started
+    unsub_dispatcher = async_dispatcher_connect(hass, SIGNAL_COORDINATOR_ADDED, track)
+
+    # Stop all listeners when the client unsubscribes or disconnects
+    @callback
+    def unsubscribe() -> None:
+        unsub_dispatcher()
+        for unsub in unsubs.values():
+            unsub()
+        unsubs.clear()
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+    connection.send_result(msg["id"])
+
+    for coordinator in hass.data.get(DOMAIN, {}).values():
+        track(coordinator)
\ No newline at end of file